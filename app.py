@@ -4,10 +4,14 @@ Upload resume and job description to get match score
 """
 
 import streamlit as st
-import os
-import tempfile
+import bisect
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from pdf_extractor import PDFExtractor
-from ats_pipeline import ATSPipeline
+from ats_pipeline import ATSPipeline, MAX_TEXT_CHARS
+from keyword_extractor import DEFAULT_SPACY_EXCLUDE
 from rag_skills_extractor import RAGSkillsExtractor
 from llm_extractor import LLMResumeExtractor
 from job_role_predictor import JobRolePredictor
@@ -21,14 +25,30 @@ st.set_page_config(
 )
 
 # Initialize components
+@st.cache_resource
+def get_ats_pipeline(use_spacy: bool = True, spacy_exclude: tuple = DEFAULT_SPACY_EXCLUDE):
+    """Build the ATS pipeline once per option set (loading spaCy is expensive)"""
+    # Load spaCy here, at startup, rather than on the first analysis
+    return ATSPipeline(use_spacy=use_spacy, spacy_exclude=spacy_exclude, lazy_load_spacy=False)
+
+@st.cache_resource
+def get_llm_extractor(provider: str, model: str, api_key: str):
+    """Reuse one LLM client per (provider, model, key) across reruns"""
+    return LLMResumeExtractor(
+        provider=provider,
+        model=model,
+        api_key=api_key
+    )
+
 @st.cache_resource
 def init_components():
     pdf_extractor = PDFExtractor()
-    ats_pipeline = ATSPipeline(use_spacy=True)
+    ats_pipeline = get_ats_pipeline(use_spacy=True)
     rag_extractor = RAGSkillsExtractor(
         skills_csv_path="data/skills_exploded (2).csv",
         max_skills=10000
     )
+    rag_extractor.warmup()
     try:
         job_predictor = JobRolePredictor()
     except Exception as e:
@@ -38,6 +58,54 @@ def init_components():
 
 pdf_extractor, ats_pipeline, rag_extractor, job_predictor = init_components()
 
+# Cached analysis stages: re-clicking Analyze with the same inputs (or only
+# toggling another option) skips the stages whose inputs did not change.
+# Arguments starting with "_" are not hashed by Streamlit; the upload is
+# keyed by its content digest instead.
+@st.cache_data(show_spinner=False)
+def extract_resume_text(resume_digest: str, _resume_bytes, _progress_callback=None):
+    return pdf_extractor.extract_text_from_bytes_safe(_resume_bytes, _progress_callback)
+
+@st.cache_data(show_spinner=False)
+def run_ats_analysis(resume_text: str, job_description: str, lazy_spacy: bool,
+                     _progress_callback=None):
+    format_analysis = pdf_extractor.detect_cv_structure(resume_text)
+    return ats_pipeline.analyze_text(
+        resume_text,
+        job_description,
+        verbose=False,
+        lazy_spacy=lazy_spacy,
+        format_analysis=format_analysis,
+        progress_callback=_progress_callback
+    )
+
+@st.cache_data(show_spinner=False)
+def run_rag_extraction(resume_text: str, _progress_callback=None):
+    # Same cap as the ATS analysis: n-gram count grows with text length
+    return rag_extractor.extract_skills_rag(resume_text[:MAX_TEXT_CHARS], threshold=0.65,
+                                            progress_callback=_progress_callback)
+
+@st.cache_data(show_spinner=False)
+def run_llm_analysis(resume_text: str, api_key: str):
+    llm_extractor = get_llm_extractor('gemini', 'gemini-2.5-flash', api_key)
+    return llm_extractor.extract_from_text(resume_text)
+
+def get_resume_digest(resume_file) -> str:
+    """Content digest of the upload, hashed once per uploaded file rather than on every rerun"""
+    file_id = getattr(resume_file, 'file_id', None)
+    cached = st.session_state.get('resume_digest')
+    if file_id is not None and cached and cached[0] == file_id:
+        return cached[1]
+    
+    resume_digest = hashlib.blake2b(resume_file.getbuffer(), digest_size=16).hexdigest()
+    st.session_state.resume_digest = (file_id, resume_digest)
+    return resume_digest
+
+def get_analysis_inputs(resume_file, job_description: str, use_rag: bool,
+                        lazy_spacy: bool, use_llm: bool) -> tuple:
+    """Key identifying an analysis run: resume digest plus job description and options"""
+    return (get_resume_digest(resume_file), job_description, use_rag, lazy_spacy, use_llm)
+
 # Main app
 def main():
     st.title("📄 ATS Resume Analyzer")
@@ -60,15 +128,18 @@ def main():
     
     # Analysis options
     st.markdown("---")
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         use_rag = st.checkbox("Enable RAG Skills Extraction", value=True, 
                              help="Use semantic similarity to detect 1000+ skills")
     with col2:
+        lazy_spacy = st.checkbox("Lazy spaCy (fast)", value=True,
+                                help="Run spaCy on the job description only and match its keywords in the resume")
+    with col3:
         use_llm = st.checkbox("Enable LLM Analysis", value=False,
                              help="Use Gemini AI for structured extraction (slower)")
-    with col3:
+    with col4:
         if use_llm:
             gemini_api_key = st.text_input("Gemini API Key", type="password",
                                           value="")
@@ -83,93 +154,123 @@ def main():
             st.error("Please paste a job description")
             return
         
-        # Save resume temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(resume_file.getbuffer())
-            resume_path = tmp_file.name
-        
-        try:
-            with st.spinner("Analyzing resume..."):
-                # Extract resume text
-                resume_text = pdf_extractor.extract_text_safe(resume_path)
-                
-                if not resume_text:
-                    st.error("Could not extract text from PDF. Please ensure it's a text-based PDF, not a scanned image.")
-                    return
-                
-                st.success(f"✅ Extracted {len(resume_text)} characters from resume")
-                
-                # Analyze format first
-                st.info("Analyzing resume format...")
-                format_analysis = pdf_extractor.detect_cv_structure(resume_text)
-                
-                # Run ATS analysis
-                st.info("Running ATS analysis...")
-                ats_results = ats_pipeline.analyze(
-                    resume_path,
-                    job_description,
-                    verbose=False,
-                    analyze_format=False
-                )
-                
-                # Add format analysis to results
-                ats_results['format_analysis'] = format_analysis
-                
-                # RAG analysis
-                rag_skills = []
-                if use_rag:
-                    st.info("Running RAG skills extraction...")
-                    rag_skills = rag_extractor.extract_skills_rag(resume_text, threshold=0.65)
-                
-                # LLM analysis
-                llm_analysis = None
-                if use_llm and gemini_api_key:
-                    st.info("Running LLM analysis...")
-                    llm_extractor = LLMResumeExtractor(
-                        provider='gemini',
-                        model='gemini-2.5-flash',
-                        api_key=gemini_api_key
-                    )
-                    llm_analysis = llm_extractor.extract_from_text(resume_text)
-                
-                # Display results
-                display_results(ats_results, rag_skills, llm_analysis, resume_text, job_predictor)
+        with st.spinner("Analyzing resume..."):
+            progress_bar = st.progress(0.0, text="Extracting resume text...")
+            
+            # Extract resume text straight from the uploaded bytes
+            resume_bytes = resume_file.getbuffer()
+            analysis_inputs = get_analysis_inputs(resume_file, job_description, use_rag, lazy_spacy, use_llm)
+            # Text extraction is reported page by page as the first 10% of the bar
+            resume_text = extract_resume_text(
+                analysis_inputs[0], resume_bytes,
+                _progress_callback=lambda fraction, message: progress_bar.progress(0.1 * fraction, text=message)
+            )
+            
+            if not resume_text:
+                st.error("Could not extract text from PDF. Please ensure it's a text-based PDF, not a scanned image.")
+                return
+            
+            st.success(f"✅ Extracted {len(resume_text)} characters from resume")
+            
+            # ATS (CPU), RAG (model inference) and LLM (network) only share the
+            # resume text, so run them concurrently. Worker threads get the
+            # script context so cached functions and st.* calls work there.
+            # The remaining 90% of the bar is the average progress of the stages.
+            stage_progress = {'ATS analysis': 0.0}
+            if use_rag:
+                stage_progress['RAG skills extraction'] = 0.0
+            if use_llm and gemini_api_key:
+                stage_progress['LLM analysis'] = 0.0
+            progress_lock = threading.Lock()
+            
+            def report_stage_progress(stage, fraction, message):
+                with progress_lock:
+                    stage_progress[stage] = fraction
+                    overall = 0.1 + 0.9 * sum(stage_progress.values()) / len(stage_progress)
+                    progress_bar.progress(min(overall, 1.0), text=f"{stage}: {message}")
+            
+            def stage_callback(stage):
+                return lambda fraction, message: report_stage_progress(stage, fraction, message)
+            
+            stages = {}
+            script_ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx,
+                                    initargs=(None, script_ctx)) as executor:
+                stages[executor.submit(run_ats_analysis, resume_text, job_description, lazy_spacy,
+                                       _progress_callback=stage_callback('ATS analysis'))] = 'ATS analysis'
+                if 'RAG skills extraction' in stage_progress:
+                    stages[executor.submit(run_rag_extraction, resume_text,
+                                           _progress_callback=stage_callback('RAG skills extraction'))] = 'RAG skills extraction'
+                if 'LLM analysis' in stage_progress:
+                    stages[executor.submit(run_llm_analysis, resume_text, gemini_api_key)] = 'LLM analysis'
                 
-        finally:
-            # Cleanup
-            if os.path.exists(resume_path):
-                os.unlink(resume_path)
+                # Stages served from the cache report nothing; mark them done here
+                for future in as_completed(stages):
+                    report_stage_progress(stages[future], 1.0, "done")
+            
+            results = {name: future.result() for future, name in stages.items()}
+            ats_results = results['ATS analysis']
+            rag_skills = results.get('RAG skills extraction', [])
+            llm_analysis = results.get('LLM analysis')
+            job_prediction = predict_job_role(rag_skills)
+            
+            # Keep results across reruns so widget clicks don't re-run the analysis;
+            # the download is serialized here once, not on every render
+            st.session_state.last_results = {
+                'inputs': analysis_inputs,
+                'ats_results': ats_results,
+                'rag_skills': rag_skills,
+                'llm_analysis': llm_analysis,
+                'resume_text': resume_text,
+                'job_prediction': job_prediction,
+                'results_json': results_to_json(ats_results, rag_skills, llm_analysis, job_prediction),
+            }
+    
+    # Display results of the last analysis while its inputs are unchanged
+    last_results = st.session_state.get('last_results')
+    if last_results and resume_file and last_results['inputs'] == get_analysis_inputs(
+            resume_file, job_description, use_rag, lazy_spacy, use_llm):
+        display_results(last_results['ats_results'], last_results['rag_skills'],
+                        last_results['llm_analysis'], last_results['resume_text'],
+                        last_results['job_prediction'], last_results['results_json'])
+
+def predict_job_role(rag_skills):
+    """Top job role predictions for the extracted skills (None when unavailable)"""
+    if not (job_predictor and rag_skills):
+        return None
+    try:
+        return job_predictor.predict_job_role(' '.join(rag_skills), top_n=5)
+    except Exception as e:
+        st.warning(f"Job prediction failed: {e}")
+        return None
 
-def display_results(ats_results, rag_skills, llm_analysis, resume_text, job_predictor=None):
+def display_results(ats_results, rag_skills, llm_analysis, resume_text,
+                    job_prediction=None, results_json=None):
     """Display analysis results"""
     
     st.markdown("---")
     st.header("📊 Analysis Results")
     
-    # Overall Score
-    overall_match = ats_results['similarity_scores']['overall_percentage']
-    skills_match = ats_results['similarity_scores']['detailed_scores']['skills_match_rate'] * 100
+    # Result sections used throughout the tabs
+    similarity = ats_results['similarity_scores']
+    scores = similarity['detailed_scores']
+    format_info = ats_results['format_analysis']
     
-    # Job prediction (if available)
-    job_prediction = None
-    if job_predictor and rag_skills:
-        try:
-            skills_text = ' '.join(rag_skills)
-            job_prediction = job_predictor.predict_job_role(skills_text, top_n=5)
-        except Exception as e:
-            st.warning(f"Job prediction failed: {e}")
+    # Overall Score
+    overall_match = similarity['overall_percentage']
+    skills_match = scores['skills_match_rate'] * 100
     
     # Big score display
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        score_color = "🟢" if overall_match >= 70 else "🟡" if overall_match >= 50 else "🔴"
+        score_color = get_match_color(overall_match)
         st.metric("Overall Match", f"{overall_match:.1f}%", delta=None)
         st.markdown(f"### {score_color} {get_match_level(overall_match)}")
     
     with col2:
         st.metric("Skills Match", f"{skills_match:.1f}%")
-        st.metric("ATS Score", f"{ats_results['format_analysis']['ats_friendly_score']}/100")
+        st.metric("ATS Score", f"{format_info['ats_friendly_score']}/100")
     
     with col3:
         if rag_skills:
@@ -205,51 +306,44 @@ def display_results(ats_results, rag_skills, llm_analysis, resume_text, job_pred
     with tab1:
         st.subheader("Skills Analysis")
         
-        matched = ats_results['similarity_scores']['matched_skills']
-        missing = ats_results['similarity_scores']['missing_skills']
+        matched = similarity['matched_skills']
+        missing = similarity['missing_skills']
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("### ✅ Matched Skills")
             if matched:
-                for skill in matched:
-                    st.markdown(f"- {skill}")
+                st.markdown("\n".join(f"- {skill}" for skill in matched))
             else:
                 st.info("No matched skills found")
         
         with col2:
             st.markdown("### ❌ Missing Skills")
             if missing:
-                for skill in missing:
-                    st.markdown(f"- {skill}")
+                st.markdown("\n".join(f"- {skill}" for skill in missing))
             else:
                 st.success("No missing skills!")
     
     with tab2:
         st.subheader("Detailed Scoring Breakdown")
         
-        scores = ats_results['similarity_scores']['detailed_scores']
-        
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**Component Scores:**")
-            st.progress(scores['skills_match_rate'], text=f"Skills Match: {scores['skills_match_rate']*100:.1f}%")
-            st.progress(scores['all_keywords_match_rate'], text=f"Keyword Match: {scores['all_keywords_match_rate']*100:.1f}%")
-            st.progress(scores['tfidf_match_rate'], text=f"TF-IDF Match: {scores['tfidf_match_rate']*100:.1f}%")
-            st.progress(scores['text_similarity'], text=f"Text Similarity: {scores['text_similarity']*100:.1f}%")
+            for label, key in (("Skills Match", 'skills_match_rate'),
+                               ("Keyword Match", 'all_keywords_match_rate'),
+                               ("Text Similarity", 'text_similarity')):
+                value = scores[key]
+                st.progress(value, text=f"{label}: {value*100:.1f}%")
         
         with col2:
             st.markdown("**Weights Used:**")
             st.code(f"""
-Skills Match:     60% (when TF-IDF fails) / 40%
-Keyword Match:    30% / 25%
-TF-IDF Match:     0% (fallback) / 20%
-Text Similarity:  10% / 15%
-
-Note: Weights automatically adjust
-if TF-IDF extraction fails.
+Skills Match:     60%
+Keyword Match:    30%
+Text Similarity:  10%
             """)
             
             st.markdown("**Match Level:**")
@@ -278,22 +372,19 @@ if TF-IDF extraction fails.
             
             with col1:
                 st.markdown(f"**🟢 Top Skills ({len(very_high)})**")
-                for skill in very_high[:20]:
-                    st.markdown(f"- {skill}")
+                st.markdown("\n".join(f"- {skill}" for skill in very_high[:20]))
                 if len(very_high) > 20:
                     st.caption(f"...and {len(very_high)-20} more")
             
             with col2:
                 st.markdown(f"**🟡 Strong Match ({len(high)})**")
-                for skill in high[:20]:
-                    st.markdown(f"- {skill}")
+                st.markdown("\n".join(f"- {skill}" for skill in high[:20]))
                 if len(high) > 20:
                     st.caption(f"...and {len(high)-20} more")
             
             with col3:
                 st.markdown(f"**🔵 Good Match ({len(good)})**")
-                for skill in good[:20]:
-                    st.markdown(f"- {skill}")
+                st.markdown("\n".join(f"- {skill}" for skill in good[:20]))
                 if len(good) > 20:
                     st.caption(f"...and {len(good)-20} more")
         else:
@@ -309,16 +400,14 @@ if TF-IDF extraction fails.
                 st.markdown("### 💻 Technical Skills")
                 tech_skills = llm_analysis.get('technical_skills', [])
                 if tech_skills:
-                    for skill in tech_skills:
-                        st.markdown(f"- {skill}")
+                    st.markdown("\n".join(f"- {skill}" for skill in tech_skills))
                 else:
                     st.info("No technical skills extracted")
                 
                 st.markdown("### 📜 Certifications")
                 certs = llm_analysis.get('certifications', [])
                 if certs:
-                    for cert in certs:
-                        st.markdown(f"- {cert}")
+                    st.markdown("\n".join(f"- {cert}" for cert in certs))
                 else:
                     st.info("No certifications found")
             
@@ -326,8 +415,7 @@ if TF-IDF extraction fails.
                 st.markdown("### 🤝 Soft Skills")
                 soft_skills = llm_analysis.get('soft_skills', [])
                 if soft_skills:
-                    for skill in soft_skills:
-                        st.markdown(f"- {skill}")
+                    st.markdown("\n".join(f"- {skill}" for skill in soft_skills))
                 else:
                     st.info("No soft skills extracted")
                 
@@ -337,13 +425,16 @@ if TF-IDF extraction fails.
                 st.markdown("### 🎓 Education")
                 education = llm_analysis.get('education', [])
                 if education:
+                    lines = []
                     for edu in education:
                         degree = edu.get('degree', 'Unknown')
                         field = edu.get('field_of_study', '')
                         institution = edu.get('institution', '')
-                        st.markdown(f"- **{degree}** {field}")
+                        line = f"- **{degree}** {field}"
                         if institution:
-                            st.caption(f"  {institution}")
+                            line += f"  \n  _{institution}_"
+                        lines.append(line)
+                    st.markdown("\n".join(lines))
                 else:
                     st.info("No education information extracted")
         else:
@@ -352,8 +443,6 @@ if TF-IDF extraction fails.
     with tab5:
         st.subheader("Resume Format Analysis")
         
-        format_info = ats_results['format_analysis']
-        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -363,8 +452,7 @@ if TF-IDF extraction fails.
             st.markdown("### 📋 Sections Detected")
             sections = format_info.get('detected_sections', [])
             if sections:
-                for section in sections:
-                    st.markdown(f"✓ {section.title()}")
+                st.markdown("  \n".join(f"✓ {section.title()}" for section in sections))
             else:
                 st.warning("No clear sections detected")
         
@@ -384,8 +472,7 @@ if TF-IDF extraction fails.
         
         if format_info.get('quality_issues'):
             st.warning("**Quality Issues:**")
-            for issue in format_info['quality_issues']:
-                st.markdown(f"⚠️ {issue}")
+            st.markdown("  \n".join(f"⚠️ {issue}" for issue in format_info['quality_issues']))
     
     if tab6 and job_prediction:
         with tab6:
@@ -413,17 +500,40 @@ if TF-IDF extraction fails.
             
             for role, prob in sorted_roles:
                 st.progress(prob, text=f"{role}: {prob:.1%}")
+    
+    # Download full results (serialized once when the analysis finished)
+    if results_json is not None:
+        st.markdown("---")
+        st.download_button(
+            "💾 Download Results (JSON)",
+            data=results_json,
+            file_name="ats_analysis_results.json",
+            mime="application/json"
+        )
+
+def results_to_json(ats_results, rag_skills, llm_analysis, job_prediction=None):
+    """Serialize the analysis for download (compact, UTF-8 encoded)"""
+    results = {
+        'ats_analysis': ats_results,
+        'rag_skills': rag_skills,
+        'llm_analysis': llm_analysis,
+        'job_prediction': job_prediction
+    }
+    return json.dumps(results, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Score thresholds (ascending) and the label for each band between them
+_MATCH_LEVEL_THRESHOLDS = [50, 65, 80]
+_MATCH_LEVELS = ["Poor Match", "Moderate Match", "Good Match", "Excellent Match"]
+_MATCH_COLOR_THRESHOLDS = [50, 70]
+_MATCH_COLORS = ["🔴", "🟡", "🟢"]
 
 def get_match_level(score):
     """Get match level text"""
-    if score >= 80:
-        return "Excellent Match"
-    elif score >= 65:
-        return "Good Match"
-    elif score >= 50:
-        return "Moderate Match"
-    else:
-        return "Poor Match"
+    return _MATCH_LEVELS[bisect.bisect_right(_MATCH_LEVEL_THRESHOLDS, score)]
+
+def get_match_color(score):
+    """Get match color indicator"""
+    return _MATCH_COLORS[bisect.bisect_right(_MATCH_COLOR_THRESHOLDS, score)]
 
 if __name__ == "__main__":
     main()
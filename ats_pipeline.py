@@ -4,11 +4,60 @@ Main pipeline for analyzing resume-job description similarity
 """
 
 import json
-from typing import Dict, Optional
+import logging
+import os
+import sys
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+import numpy as np
 from pdf_extractor import PDFExtractor
-from keyword_extractor import KeywordExtractor
+from keyword_extractor import KeywordExtractor, DEFAULT_SPACY_EXCLUDE, SKILL_TABLE
 from similarity_calculator import SimilarityCalculator
 
+try:
+    # Fast JSON serializer for save_results (optional)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# Called as progress_callback(fraction_done, message) at stage boundaries
+ProgressCallback = Callable[[float, str], None]
+
+# Characters of resume / job description text that get analyzed (roughly the
+# first ~5 pages). NLP cost grows with text length while most of the ATS
+# signal is near the top; this also stays well below spaCy's max_length.
+MAX_TEXT_CHARS = int(os.environ.get("ATS_MAX_TEXT_CHARS", "30000"))
+
+# In lazy_spacy mode, skip spaCy on the job description when the regex skill
+# pass already finds at least this many technical skills (0 = always run spaCy)
+SPACY_FALLBACK_MIN_SKILLS = int(os.environ.get("ATS_SPACY_FALLBACK_MIN_SKILLS", "0"))
+
+# Resumes with fewer text characters than this on their first page are
+# rejected as scanned images before the full extraction (0 = never probe)
+SCANNED_PDF_MIN_CHARS = int(os.environ.get("ATS_SCANNED_PDF_MIN_CHARS", "10"))
+
+
+@dataclass(frozen=True)
+class JobContext:
+    """Job description analysis reused across resumes (see ATSPipeline.prepare_job)"""
+    job_description: str                # Truncated to the pipeline's max_text_chars
+    keywords: Dict[str, List[str]]      # KeywordExtractor.extract_keywords result
+    technical_skills_mask: np.ndarray   # Technical skills as a mask over SKILL_TABLE
+    term_counts: Counter                # SimilarityCalculator.term_counts result
+    lazy_spacy: bool                    # Keyword mode the context was prepared for
+
+
+def _progress_logger(verbose: bool) -> Callable[[str], None]:
+    """Progress messages go to the module logger at INFO when verbose, else DEBUG"""
+    return logger.info if verbose else logger.debug
+
 
 class ATSPipeline:
     """
@@ -21,122 +70,260 @@ class ATSPipeline:
     4. Provides recommendations
     """
     
-    def __init__(self, use_spacy: bool = True):
+    def __init__(self, use_spacy: bool = True,
+                 spacy_exclude: Optional[Sequence[str]] = DEFAULT_SPACY_EXCLUDE,
+                 max_text_chars: Optional[int] = MAX_TEXT_CHARS,
+                 lazy_load_spacy: bool = True,
+                 spacy_fallback_min_skills: int = SPACY_FALLBACK_MIN_SKILLS):
         """
         Initialize the ATS pipeline
         
         Args:
             use_spacy: Whether to use spaCy for advanced NLP
+            spacy_exclude: spaCy pipeline components to skip when loading the model
+            max_text_chars: Analyze only the first max_text_chars characters of the
+                resume and job description (None = no limit)
+            lazy_load_spacy: Build the keyword extractor and load the spaCy model on
+                first use instead of at construction
+            spacy_fallback_min_skills: In lazy_spacy mode, only run spaCy on the job
+                description when regex finds fewer technical skills than this (0 = always)
         """
+        # Kept so worker processes (see analyze_many) can build the same pipeline
+        self._init_kwargs = {
+            'use_spacy': use_spacy,
+            'spacy_exclude': spacy_exclude,
+            'max_text_chars': max_text_chars,
+            'lazy_load_spacy': lazy_load_spacy,
+            'spacy_fallback_min_skills': spacy_fallback_min_skills,
+        }
+        self.max_text_chars = max_text_chars
+        self.spacy_fallback_min_skills = spacy_fallback_min_skills
         self.pdf_extractor = PDFExtractor()
-        self.keyword_extractor = KeywordExtractor(use_spacy=use_spacy)
         self.similarity_calculator = SimilarityCalculator()
+        self._last_job_context = None
+        self._last_resume_terms = None
+        
+        if not lazy_load_spacy:
+            self.keyword_extractor  # build it (and load spaCy) now
+    
+    @cached_property
+    def keyword_extractor(self) -> KeywordExtractor:
+        """Keyword extractor, built on first use"""
+        return KeywordExtractor(use_spacy=self._init_kwargs['use_spacy'],
+                                spacy_exclude=self._init_kwargs['spacy_exclude'],
+                                lazy_load=self._init_kwargs['lazy_load_spacy'])
     
     def analyze(self, resume_pdf_path: str, job_description: str, 
-                verbose: bool = True, analyze_format: bool = True) -> Dict:
+                verbose: bool = True, analyze_format: bool = True,
+                lazy_spacy: bool = False,
+                progress_callback: Optional[ProgressCallback] = None) -> Dict:
         """
         Analyze resume against job description
         
         Args:
             resume_pdf_path: Path to the resume PDF file
             job_description: Job description text
-            verbose: Whether to print progress messages
+            verbose: Log progress messages at INFO level (DEBUG otherwise) and print the summary
             analyze_format: Whether to analyze CV format and structure
+            lazy_spacy: Run spaCy on the job description only and match its
+                keywords in the resume with regex (much faster on long resumes)
+            progress_callback: Optional callable(fraction_done, message) invoked
+                as each stage starts/finishes
             
         Returns:
             Dictionary containing complete analysis results
         """
-        if verbose:
-            print("🔍 Starting ATS Analysis...")
+        log = _progress_logger(verbose)
+        log("🔍 Starting ATS Analysis...")
         
-        # Step 0: Analyze PDF format (if requested)
-        format_analysis = None
-        if analyze_format:
-            if verbose:
-                print("📋 Analyzing CV format and structure...")
-            
-            format_analysis = self.pdf_extractor.analyze_pdf(resume_pdf_path)
-            
-            if format_analysis and format_analysis.get('success'):
-                if verbose:
-                    structure = format_analysis['structure_analysis']
-                    print(f"   ✓ CV Format: {structure['cv_format']}")
-                    print(f"   ✓ Sections Detected: {structure['section_count']}")
-                    print(f"   ✓ ATS Score: {structure['ats_friendly_score']}/100 - {structure['ats_friendly_rating']}")
+        # Scanned or unreadable PDFs fail here, before any full-document parse
+        probe_error = self._probe_resume(resume_pdf_path)
+        if probe_error:
+            log("   ✗ %s", probe_error)
+            return {
+                'error': probe_error,
+                'success': False,
+                'format_analysis': None
+            }
+        
+        if not analyze_format:
+            return self._analyze_pdf_text(resume_pdf_path, job_description, verbose,
+                                          lazy_spacy, progress_callback)
+        
+        # Step 0: Analyze PDF format. It only needs the PDF, so it runs in a
+        # worker thread while text and keywords are extracted.
+        log("📋 Analyzing CV format and structure in the background...")
+        self._report_progress(progress_callback, 0.0, "Analyzing CV format...")
+        
+        # analyze_text awaits the future (and logs the format results) before
+        # printing the summary
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            format_future = executor.submit(self.pdf_extractor.analyze_pdf, resume_pdf_path)
+            results = self._analyze_pdf_text(resume_pdf_path, job_description, verbose,
+                                             lazy_spacy, progress_callback, format_future)
+            results['format_analysis'] = format_future.result()
+        
+        return results
+    
+    def _analyze_pdf_text(self, resume_pdf_path: str, job_description: str, verbose: bool,
+                          lazy_spacy: bool, progress_callback: Optional[ProgressCallback],
+                          format_future: Optional[Future] = None) -> Dict:
+        """Extract text from the resume PDF and analyze it (Steps 1-5)"""
+        log = _progress_logger(verbose)
         
         # Step 1: Extract text from resume PDF
-        if verbose:
-            print("📄 Extracting text from resume PDF...")
+        log("📄 Extracting text from resume PDF...")
+        self._report_progress(progress_callback, 0.1, "Extracting text from resume PDF...")
         
         try:
-            resume_text = self.pdf_extractor.extract_text(resume_pdf_path)
+            # Long documents are split into page ranges across processes
+            resume_text = self.pdf_extractor.extract_text_parallel(resume_pdf_path)
             if not resume_text:
                 return {
                     'error': 'Failed to extract text from resume PDF',
                     'success': False,
-                    'format_analysis': format_analysis
+                    'format_analysis': None
                 }
         except Exception as e:
             return {
                 'error': f'Error reading PDF: {str(e)}',
                 'success': False,
-                'format_analysis': format_analysis
+                'format_analysis': None
             }
         
-        if verbose:
-            print(f"   ✓ Extracted {len(resume_text)} characters from resume")
+        log("   ✓ Extracted %d characters from resume", len(resume_text))
         
-        # Step 2: Extract keywords from resume
-        if verbose:
-            print("🔑 Extracting keywords from resume...")
+        return self.analyze_text(
+            resume_text,
+            job_description,
+            verbose=verbose,
+            lazy_spacy=lazy_spacy,
+            format_analysis=format_future,
+            progress_callback=progress_callback
+        )
+    
+    def _probe_resume(self, resume_pdf_path: str) -> Optional[str]:
+        """Error message if the resume PDF is unreadable or looks like a scanned image, else None"""
+        if SCANNED_PDF_MIN_CHARS <= 0:
+            return None
         
-        resume_keywords = self.keyword_extractor.extract_keywords(resume_text)
+        try:
+            first_page_chars = self.pdf_extractor.quick_probe(resume_pdf_path)
+        except Exception as e:
+            return f'Error reading PDF: {str(e)}'
         
-        if verbose:
-            print(f"   ✓ Found {len(resume_keywords.get('all_keywords', []))} unique keywords")
-            print(f"   ✓ Detected {len(resume_keywords.get('technical_skills', []))} technical skills")
+        if first_page_chars < SCANNED_PDF_MIN_CHARS:
+            return 'Resume PDF has almost no extractable text (likely a scanned image)'
+        return None
+    
+    def analyze_text(self, resume_text: str, job_description: str,
+                     verbose: bool = True, lazy_spacy: bool = False,
+                     format_analysis: Optional[Dict | Future] = None,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     job_context: Optional[JobContext] = None) -> Dict:
+        """
+        Analyze already-extracted resume text against job description
         
-        # Step 3: Extract keywords from job description
-        if verbose:
-            print("🔑 Extracting keywords from job description...")
+        Args:
+            resume_text: Resume text (e.g. from PDFExtractor.extract_text_from_bytes)
+            job_description: Job description text
+            verbose: Log progress messages at INFO level (DEBUG otherwise) and print the summary
+            lazy_spacy: Run spaCy on the job description only and match its
+                keywords in the resume with regex (much faster on long resumes)
+            format_analysis: Optional format analysis to include in the results, or a
+                Future of one still running (awaited and logged before the summary)
+            progress_callback: Optional callable(fraction_done, message) invoked
+                as each stage starts/finishes
+            job_context: prepare_job(job_description) result, when the same job
+                description is scored against several resumes
+            
+        Returns:
+            Dictionary containing complete analysis results
+        """
+        log = _progress_logger(verbose)
         
-        job_keywords = self.keyword_extractor.extract_keywords(job_description)
+        # Only the start of very long texts is analyzed
+        resume_length, job_length = len(resume_text), len(job_description)
+        if self.max_text_chars:
+            resume_text = resume_text[:self.max_text_chars]
+            job_description = job_description[:self.max_text_chars]
         
-        if verbose:
-            print(f"   ✓ Found {len(job_keywords.get('all_keywords', []))} unique keywords")
-            print(f"   ✓ Detected {len(job_keywords.get('technical_skills', []))} technical skills")
+        # Step 2-3: Extract keywords from resume and job description
+        log("🔑 Extracting keywords from resume and job description...")
+        self._report_progress(progress_callback, 0.2, "Extracting keywords...")
+        
+        job_keywords = job_context.keywords if job_context else None
+        if lazy_spacy:
+            if job_keywords is None:
+                job_keywords = self.extract_job_keywords(job_description, lazy_spacy=True)
+            resume_keywords = self.keyword_extractor.extract_keywords_lazy(resume_text, job_keywords)
+        elif job_keywords is not None:
+            resume_keywords = self.keyword_extractor.extract_keywords(resume_text)
+        else:
+            # Both documents go through spaCy in a single nlp.pipe batch
+            resume_keywords, job_keywords = self.keyword_extractor.extract_keywords_batch(
+                [resume_text, job_description]
+            )
+        
+        # Looked up once for the log lines, the scoring and the results
+        resume_all_keywords = resume_keywords.get('all_keywords', [])
+        resume_technical_skills = resume_keywords.get('technical_skills', [])
+        job_all_keywords = job_keywords.get('all_keywords', [])
+        job_technical_skills = job_keywords.get('technical_skills', [])
+        
+        # %-style arguments: nothing is formatted when the level is disabled
+        log("   ✓ Resume: %d unique keywords, %d technical skills",
+            len(resume_all_keywords), len(resume_technical_skills))
+        log("   ✓ Job description: %d unique keywords, %d technical skills",
+            len(job_all_keywords), len(job_technical_skills))
         
         # Step 4: Calculate similarity scores
-        if verbose:
-            print("📊 Calculating similarity scores...")
+        log("📊 Calculating similarity scores...")
+        self._report_progress(progress_callback, 0.7, "Calculating similarity scores...")
         
         similarity_results = self.similarity_calculator.calculate_weighted_score(
             resume_text,
             job_description,
             resume_keywords,
-            job_keywords
+            job_keywords,
+            job_terms=job_context.term_counts if job_context else None,
+            resume_terms=self._resume_term_counts(resume_text),
+            skill_masks=(
+                KeywordExtractor.skills_mask(resume_technical_skills),
+                job_context.technical_skills_mask if job_context
+                else KeywordExtractor.skills_mask(job_technical_skills),
+                SKILL_TABLE
+            )
         )
         
-        if verbose:
-            print(f"   ✓ Overall Match Score: {similarity_results['overall_percentage']}%")
-            print(f"   ✓ Match Level: {similarity_results['match_level']}")
+        log("   ✓ Overall Match Score: %s%%", similarity_results['overall_percentage'])
+        log("   ✓ Match Level: %s", similarity_results['match_level'])
         
         # Step 5: Generate recommendations
         recommendations = self.similarity_calculator.generate_recommendations(similarity_results)
         
+        if isinstance(format_analysis, Future):
+            format_analysis = format_analysis.result()
+            if format_analysis and format_analysis.get('success'):
+                structure = format_analysis['structure_analysis']
+                log("   ✓ CV Format: %s", structure['cv_format'])
+                log("   ✓ Sections Detected: %s", structure['section_count'])
+                log("   ✓ ATS Score: %s/100 - %s",
+                    structure['ats_friendly_score'], structure['ats_friendly_rating'])
+        
         # Compile complete results
         results = {
             'success': True,
             'format_analysis': format_analysis,
             'resume_analysis': {
-                'text_length': len(resume_text),
+                'text_length': resume_length,
                 'keywords': resume_keywords,
-                'technical_skills': resume_keywords.get('technical_skills', [])
+                'technical_skills': resume_technical_skills
             },
             'job_analysis': {
-                'text_length': len(job_description),
+                'text_length': job_length,
                 'keywords': job_keywords,
-                'technical_skills': job_keywords.get('technical_skills', [])
+                'technical_skills': job_technical_skills
             },
             'similarity_scores': similarity_results,
             'recommendations': recommendations
@@ -148,8 +335,180 @@ class ATSPipeline:
             print("="*60)
             self.print_summary(results)
         
+        self._report_progress(progress_callback, 1.0, "ATS analysis complete")
+        
         return results
     
+    def _resume_term_counts(self, resume_text: str) -> Counter:
+        """term_counts of the resume text; the most recent one is memoized for analyze_jobs"""
+        last = self._last_resume_terms
+        if last is not None and last[0] == resume_text:
+            return last[1]
+        
+        resume_terms = self.similarity_calculator.term_counts(resume_text)
+        self._last_resume_terms = (resume_text, resume_terms)
+        return resume_terms
+    
+    def extract_job_keywords(self, job_description: str, lazy_spacy: bool = False) -> Dict:
+        """
+        Extract the keywords of a job description (as analyze_text does)
+        
+        Args:
+            job_description: Job description text
+            lazy_spacy: Must match the lazy_spacy mode the keywords will be used with
+            
+        Returns:
+            Keyword dictionary (same format as KeywordExtractor.extract_keywords)
+        """
+        if self.max_text_chars:
+            job_description = job_description[:self.max_text_chars]
+        if lazy_spacy:
+            return self.keyword_extractor.extract_keywords(
+                job_description, spacy_min_skills=self.spacy_fallback_min_skills or None
+            )
+        return self.keyword_extractor.extract_keywords(job_description)
+    
+    def prepare_job(self, job_description: str, lazy_spacy: bool = False) -> JobContext:
+        """
+        Analyze a job description once so it can be scored against many resumes
+        
+        The most recent context is memoized, so repeated calls with the same
+        job description are free.
+        
+        Args:
+            job_description: Job description text
+            lazy_spacy: Keyword mode the context will be used with (see analyze_text)
+            
+        Returns:
+            JobContext for analyze_with_job / analyze_text(job_context=...)
+        """
+        if self.max_text_chars:
+            job_description = job_description[:self.max_text_chars]
+        
+        job_context = self._last_job_context
+        if (job_context is not None and job_context.lazy_spacy == lazy_spacy
+                and job_context.job_description == job_description):
+            return job_context
+        
+        keywords = self.extract_job_keywords(job_description, lazy_spacy)
+        job_context = JobContext(
+            job_description=job_description,
+            keywords=keywords,
+            technical_skills_mask=KeywordExtractor.skills_mask(keywords.get('technical_skills', [])),
+            term_counts=self.similarity_calculator.term_counts(job_description),
+            lazy_spacy=lazy_spacy
+        )
+        self._last_job_context = job_context
+        return job_context
+    
+    def analyze_with_job(self, resume_pdf_path: str, job_context: JobContext,
+                         analyze_format: bool = False) -> Dict:
+        """
+        Analyze a resume PDF against a prepared job description
+        
+        Args:
+            resume_pdf_path: Path to the resume PDF file
+            job_context: Result of prepare_job
+            analyze_format: Whether to also run the CV format analysis
+            
+        Returns:
+            Dictionary containing complete analysis results, with a 'resume_path' key
+        """
+        return self.analyze_jobs(resume_pdf_path, [job_context], analyze_format)[0]
+    
+    def analyze_jobs(self, resume_pdf_path: str, job_contexts: Iterable[JobContext],
+                     analyze_format: bool = False) -> List[Dict]:
+        """
+        Analyze one resume PDF against several prepared job descriptions
+        
+        The PDF is probed, extracted (and format-analyzed) once; its keywords
+        and term counts are memoized, so each job only pays for its own scoring.
+        
+        Args:
+            resume_pdf_path: Path to the resume PDF file
+            job_contexts: prepare_job results, one per job description
+            analyze_format: Whether to also run the CV format analysis
+            
+        Returns:
+            One results dictionary per job context, in input order, each with a 'resume_path' key
+        """
+        format_analysis = None
+        error = self._probe_resume(resume_pdf_path)
+        if not error:
+            if analyze_format:
+                format_analysis = self.pdf_extractor.analyze_pdf(resume_pdf_path)
+            try:
+                resume_text = self.pdf_extractor.extract_text(resume_pdf_path)
+                if not resume_text:
+                    error = 'Failed to extract text from resume PDF'
+            except Exception as e:
+                error = f'Error reading PDF: {str(e)}'
+        
+        all_results = []
+        for job_context in job_contexts:
+            if error:
+                results = {'error': error, 'success': False, 'format_analysis': format_analysis}
+            else:
+                results = self.analyze_text(resume_text, job_context.job_description, verbose=False,
+                                            lazy_spacy=job_context.lazy_spacy,
+                                            format_analysis=format_analysis,
+                                            job_context=job_context)
+            results['resume_path'] = resume_pdf_path
+            all_results.append(results)
+        return all_results
+    
+    def analyze_many(self, resume_pdf_paths: List[str], job_description: str,
+                     lazy_spacy: bool = False, analyze_format: bool = False,
+                     max_workers: Optional[int] = None, chunksize: int = 8) -> List[Dict]:
+        """
+        Analyze many resumes against one job description using a process pool
+        
+        The job description is prepared once here (prepare_job); each worker
+        process builds its own pipeline once and then scores resumes
+        (text extraction, resume keywords, similarity).
+        
+        Args:
+            resume_pdf_paths: Paths to the resume PDF files
+            job_description: Job description text
+            lazy_spacy: See analyze_text
+            analyze_format: Whether to also run the CV format analysis per resume
+            max_workers: Number of worker processes (default: os.cpu_count())
+            chunksize: Number of resumes sent to a worker at a time
+            
+        Returns:
+            One results dictionary per resume, in input order, each with a 'resume_path' key
+        """
+        job_context = self.prepare_job(job_description, lazy_spacy)
+        options = (job_context, analyze_format)
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        if max_workers == 1 or len(resume_pdf_paths) <= 1:
+            return [self.analyze_with_job(path, *options) for path in resume_pdf_paths]
+        
+        # Workers blank out the job analysis (the same for every resume); it is
+        # filled in here instead of being pickled once per resume
+        job_analysis = {
+            'text_length': len(job_description),
+            'keywords': job_context.keywords,
+            'technical_skills': job_context.keywords.get('technical_skills', [])
+        }
+        
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(resume_pdf_paths)),
+                                 initializer=_init_worker,
+                                 initargs=(self._init_kwargs, options)) as executor:
+            all_results = list(executor.map(_analyze_in_worker, resume_pdf_paths, chunksize=chunksize))
+        
+        for results in all_results:
+            if results['success']:
+                results['job_analysis'] = job_analysis
+        return all_results
+    
+    @staticmethod
+    def _report_progress(progress_callback: Optional[ProgressCallback], fraction: float, message: str):
+        """Forward a stage boundary to the progress callback, if any"""
+        if progress_callback is not None:
+            progress_callback(fraction, message)
+    
     def print_summary(self, results: Dict):
         """
         Print a formatted summary of the analysis results
@@ -162,62 +521,94 @@ class ATSPipeline:
             return
         
         similarity = results['similarity_scores']
+        detailed_scores = similarity['detailed_scores']
         
-        print(f"\n🎯 Overall Match Score: {similarity['overall_percentage']}%")
-        print(f"📊 Match Level: {similarity['match_level']}")
+        # Build the whole summary and write it to stdout in one call
+        lines = [
+            f"\n🎯 Overall Match Score: {similarity['overall_percentage']}%",
+            f"📊 Match Level: {similarity['match_level']}",
+            "\n📋 Detailed Scores:",
+            f"   • Text Similarity: {detailed_scores['text_similarity']:.2%}",
+            f"   • Skills Match: {detailed_scores['skills_match_rate']:.2%}",
+            f"   • Keywords Match: {detailed_scores['all_keywords_match_rate']:.2%}",
+        ]
+        lines += self._format_skill_list("\n✅ Matched Skills", similarity['matched_skills'])
+        lines += self._format_skill_list("\n❌ Missing Skills", similarity['missing_skills'])
+        lines.append("\n💡 Recommendations:")
+        lines += [f"   {rec}" for rec in results['recommendations']]
+        lines.append("")
         
-        print(f"\n📋 Detailed Scores:")
-        print(f"   • Text Similarity: {similarity['detailed_scores']['text_similarity']:.2%}")
-        print(f"   • Skills Match: {similarity['detailed_scores']['skills_match_rate']:.2%}")
-        print(f"   • Keywords Match: {similarity['detailed_scores']['tfidf_match_rate']:.2%}")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+    
+    @staticmethod
+    def _format_skill_list(title: str, skills: Iterable[str], limit: int = 10) -> List[str]:
+        """Summary lines for the first `limit` skills and how many more there are (skills may be any iterable)"""
+        skills = iter(skills)
+        head = list(islice(skills, limit))
+        remaining = sum(1 for _ in skills)
         
-        print(f"\n✅ Matched Skills ({len(similarity['matched_skills'])}):")
-        if similarity['matched_skills']:
-            for skill in similarity['matched_skills'][:10]:
-                print(f"   • {skill}")
-            if len(similarity['matched_skills']) > 10:
-                print(f"   ... and {len(similarity['matched_skills']) - 10} more")
+        lines = [f"{title} ({len(head) + remaining}):"]
+        if head:
+            lines += [f"   • {skill}" for skill in head]
+            if remaining:
+                lines.append(f"   ... and {remaining} more")
         else:
-            print("   None")
-        
-        print(f"\n❌ Missing Skills ({len(similarity['missing_skills'])}):")
-        if similarity['missing_skills']:
-            for skill in similarity['missing_skills'][:10]:
-                print(f"   • {skill}")
-            if len(similarity['missing_skills']) > 10:
-                print(f"   ... and {len(similarity['missing_skills']) - 10} more")
-        else:
-            print("   None")
-        
-        print(f"\n💡 Recommendations:")
-        for rec in results['recommendations']:
-            print(f"   {rec}")
+            lines.append("   None")
+        return lines
     
-    def save_results(self, results: Dict, output_path: str):
+    def save_results(self, results: Dict | List[Dict], output_path: str):
         """
         Save analysis results to a JSON file
         
         Args:
-            results: Analysis results dictionary
+            results: Analysis results dictionary (or a list of them, from analyze_many)
             output_path: Path to save the JSON file
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"💾 Results saved to: {output_path}")
 
 
+# Per-process state for ATSPipeline.analyze_many
+_worker_pipeline = None
+_worker_options = None
+
+
+def _init_worker(init_kwargs: Dict, options: tuple):
+    """Build the worker process's pipeline once"""
+    global _worker_pipeline, _worker_options
+    _worker_pipeline = ATSPipeline(**init_kwargs)
+    _worker_options = options
+
+
+def _analyze_in_worker(resume_pdf_path: str) -> Dict:
+    """Analyze one resume in a worker process (without the shared job analysis)"""
+    results = _worker_pipeline.analyze_with_job(resume_pdf_path, *_worker_options)
+    if results['success']:
+        results['job_analysis'] = None
+    return results
+
+
 def main():
     """Example usage of the ATS Pipeline"""
-    import sys
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     if len(sys.argv) < 3:
-        print("Usage: python ats_pipeline.py <resume.pdf> <job_description.txt>")
+        print("Usage: python ats_pipeline.py <resume.pdf> [<resume2.pdf> ...] <job_description.txt>")
         print("\nExample:")
         print("  python ats_pipeline.py resume.pdf job_description.txt")
         sys.exit(1)
     
-    resume_path = sys.argv[1]
-    job_desc_path = sys.argv[2]
+    resume_paths = sys.argv[1:-1]
+    job_desc_path = sys.argv[-1]
     
     # Read job description
     try:
@@ -229,7 +620,25 @@ def main():
     
     # Run pipeline
     pipeline = ATSPipeline(use_spacy=True)
-    results = pipeline.analyze(resume_path, job_description, verbose=True)
+    
+    if len(resume_paths) > 1:
+        # Screen several resumes in parallel and rank them
+        all_results = pipeline.analyze_many(resume_paths, job_description)
+        ranked = sorted(
+            (r for r in all_results if r.get('success')),
+            key=lambda r: r['similarity_scores']['overall_percentage'],
+            reverse=True
+        )
+        print(f"\n🏆 Ranked {len(ranked)}/{len(all_results)} resumes:")
+        for i, r in enumerate(ranked, 1):
+            print(f"   {i}. {r['resume_path']}: {r['similarity_scores']['overall_percentage']}%")
+        for r in all_results:
+            if not r.get('success'):
+                print(f"   ❌ {r['resume_path']}: {r['error']}")
+        pipeline.save_results(all_results, 'ats_analysis_results.json')
+        return
+    
+    results = pipeline.analyze(resume_paths[0], job_description, verbose=True)
     
     # Save results
     if results.get('success'):
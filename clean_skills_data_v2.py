@@ -3,231 +3,364 @@ Enhanced Skills Dataset Cleaner v2
 Intelligent filtering to remove non-skills, fix formatting, and validate skills
 """
 
+import os
 import pandas as pd
 import re
-from collections import Counter
-from typing import List, Set
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Set, Tuple
 import numpy as np
 
+try:
+    # Arrow-backed strings let clean_dataframe run in C++ kernels (optional)
+    import pyarrow  # noqa: F401
+    ARROW_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    ARROW_STRING_DTYPE = None
+
+try:
+    # google-re2: linear-time matching for the big literal alternations (optional)
+    import re2
+except ImportError:
+    re2 = None
+
+# Rows of the input CSV cleaned at a time by main()
+CHUNK_SIZE = int(os.environ.get("ATS_CLEAN_CHUNK_SIZE", "200000"))
+
+# Worker processes cleaning chunks in parallel (0 = one per CPU)
+WORKERS = int(os.environ.get("ATS_CLEAN_WORKERS", "0")) or os.cpu_count() or 1
+
+# Distinct strings whose is_valid_skill / normalize_skill results a cleaner
+# remembers. Bounded so a long-lived worker's memory stays flat across chunks;
+# count_skills already validates and normalizes each chunk's unique strings once.
+VALID_SKILL_CACHE_SIZE = int(os.environ.get("ATS_VALID_SKILL_CACHE_SIZE", "65536"))
+
+
+# Common multi-word skills that should NOT be split
+MULTI_WORD_SKILLS = frozenset({
+    # Programming & Development
+    'machine learning', 'deep learning', 'natural language processing', 'computer vision',
+    'data science', 'data analysis', 'data analytics', 'data engineering', 'data mining',
+    'software development', 'web development', 'mobile development', 'full stack',
+    'front end', 'back end', 'frontend', 'backend', 'agile development', 
+    'object oriented programming', 'test driven development', 'continuous integration', 
+    'continuous deployment', 'version control', 'source control', 'code review',
+    
+    # Cloud & Infrastructure
+    'cloud computing', 'amazon web services', 'microsoft azure', 'google cloud',
+    'infrastructure as code', 'configuration management', 'containerization',
+    'cloud architecture', 'cloud security', 'devops', 'site reliability',
+    
+    # Business & Management
+    'project management', 'product management', 'business analysis', 'business intelligence',
+    'business development', 'strategic planning', 'change management', 'risk management',
+    'supply chain', 'supply chain management', 'inventory management', 'quality assurance',
+    'quality control', 'process improvement', 'continuous improvement', 'performance management',
+    'stakeholder management', 'vendor management', 'budget management', 'financial analysis',
+    'financial modeling', 'cost analysis', 'root cause analysis', 'gap analysis',
+    'account management', 'client management', 'relationship management',
+    
+    # Analytics & Statistics
+    'statistical analysis', 'predictive modeling', 'predictive analytics', 'time series',
+    'time series analysis', 'regression analysis', 'sentiment analysis', 'customer analytics',
+    'marketing analytics', 'web analytics', 'social media analytics', 'business analytics',
+    'data visualization', 'data warehousing', 'data governance',
+    
+    # Design & Creative
+    'user experience', 'user interface', 'graphic design', 'web design', 'ui design',
+    'ux design', 'visual design', 'interaction design', 'responsive design',
+    'ui ux', 'ux ui', 'product design', 'service design',
+    
+    # Soft Skills
+    'problem solving', 'critical thinking', 'analytical thinking', 'creative thinking',
+    'decision making', 'time management', 'stress management', 'conflict resolution',
+    'team building', 'public speaking', 'cross functional', 'customer service',
+    'interpersonal skills', 'communication skills', 'leadership skills', 'teamwork',
+    'attention to detail', 'organizational skills', 'multitasking',
+    
+    # Operations & Manufacturing
+    'operations management', 'process optimization', 'lean manufacturing', 'six sigma',
+    'total quality management', 'just in time', 'demand planning', 'capacity planning',
+    'production planning', 'resource planning', 'workforce planning', 'lean six sigma',
+    'kaizen', 'root cause', 'continuous improvement',
+    
+    # Frameworks & Tools
+    'spring boot', 'ruby on rails', 'entity framework', 'apache spark', 'big data',
+    'microsoft excel', 'microsoft office', 'google analytics', 'google sheets',
+    'power bi', 'sql server', 'visual studio', 'react native', 'node js',
+    
+    # Methodologies
+    'agile methodology', 'scrum methodology', 'waterfall methodology', 'kanban',
+    'design thinking', 'human centered design', 'agile scrum',
+    
+    # Healthcare & Safety
+    'patient care', 'emergency response', 'first aid', 'cpr', 'basic life support',
+    'advanced life support', 'infection control', 'medical terminology',
+    'electronic medical records', 'hipaa compliance',
+    
+    # Education & Certifications
+    'high school diploma', 'bachelor degree', 'master degree', 'phd', 'mba',
+    'associate degree', 'professional development', 'continuing education',
+    
+    # Sales & Marketing
+    'sales management', 'digital marketing', 'content marketing', 'email marketing',
+    'social media', 'social media marketing', 'search engine optimization', 'seo',
+    'search engine marketing', 'sem', 'pay per click', 'ppc', 'lead generation',
+    'customer relationship management', 'crm',
+    
+    # Finance & Accounting
+    'financial reporting', 'financial planning', 'accounts payable', 'accounts receivable',
+    'general ledger', 'cost accounting', 'tax preparation', 'financial statements',
+    'balance sheet', 'income statement', 'cash flow',
+    
+    # HR & Recruitment
+    'human resources', 'talent acquisition', 'employee relations', 'performance reviews',
+    'talent management', 'workforce management', 'compensation benefits',
+    'onboarding', 'talent development',
+    
+    # Legal & Compliance
+    'regulatory compliance', 'contract management', 'legal research', 'contract negotiation',
+    'intellectual property', 'employment law', 'corporate law',
+    
+    # Construction & Trades
+    'construction management', 'building codes', 'safety regulations', 'osha',
+    'construction safety', 'project scheduling', 'blueprint reading',
+    
+    # Hospitality & Service
+    'food safety', 'food service', 'customer satisfaction', 'guest services',
+    'restaurant management', 'hotel management', 'event planning',
+    
+    # Logistics & Transportation
+    'logistics management', 'transportation management', 'warehouse management',
+    'route planning', 'fleet management', 'distribution management',
+})
+
+
+# Phrases that indicate NON-skill entries (job duties, requirements, etc.)
+NON_SKILL_PHRASES = frozenset({
+    'experience in', 'experience with', 'knowledge of', 'ability to',
+    'responsible for', 'duties include', 'years of', 'working with',
+    'familiarity with', 'understanding of', 'exposure to', 'comfortable with',
+    'skilled in', 'proficient in', 'expert in', 'background in',
+    'must have', 'should have', 'required to', 'able to', 'willing to',
+    'demonstrated ability', 'proven ability', 'strong knowledge',
+    'minimum of', 'at least', 'or more', 'or equivalent',
+    'post construction', 'site visits', 'compliance site', 'ground water',
+    'level iv', 'level iii', 'level ii', 'level i', 'grade',
+    'extra hours', 'working hours', 'shift work', 'overtime',
+    'repetitive', 'physically demanding', 'heavy lifting',
+    'transfer station', 'pumpage inventories', 'tenure and promotion',
+    'directory maintenance', 'recovery processes', 'testing service',
+})
+
+
+# Generic/vague terms that aren't specific skills
+VAGUE_TERMS = frozenset({
+    'skills', 'knowledge', 'abilities', 'competencies', 'proficiencies',
+    'expertise', 'capabilities', 'qualifications', 'requirements',
+    'responsibilities', 'duties', 'tasks', 'activities', 'functions',
+    'operations', 'procedures', 'processes', 'methods', 'techniques',
+    'tools', 'systems', 'applications', 'platforms', 'technologies',
+    'programs', 'services', 'products', 'solutions', 'resources',
+    'materials', 'equipment', 'facilities', 'environment', 'setting',
+    'area', 'field', 'domain', 'industry', 'sector', 'market',
+    'business', 'company', 'organization', 'department', 'team',
+    'position', 'role', 'job', 'work', 'career', 'professional',
+    'certification', 'license', 'credential', 'diploma', 'certificate',
+    'training', 'education', 'degree', 'course', 'program', 'class',
+    'experience', 'optional', 'desirable', 'desired', 'preferred', 'required',
+    'if applicable', 'one', 'two', 'three', 'four', 'five',
+    'physical requirements', 'physical demands', 'physical ability', 'physical abilities',
+    'certifications', 'licensure', 'registration', 'software', 'system', 'standards',
+    'travel', 'lifting', 'management', 'compliance', 'applicable',
+    # Additional vague terms from data
+    'asset', 'benefits', 'pto', 'advantageous', 'plan', 'process',
+    'designation', 'bonus', 'clearance', 'if required', 'regulations',
+    'testing', 'design', 'analysis', 'documentation', 'guidelines',
+    'membership', 'programming', 'engineering', 'nursing', 'process',
+})
+
+
+# Common noise words
+NOISE_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'a', 'an', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might',
+    'can', 'must', 'shall', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'under', 'again', 'further', 'then',
+    'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'both',
+    'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor',
+    'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'etc',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'them', 'their', 'this', 'that',
+    'including', 'required', 'preferred', 'plus', 'strong', 'excellent',
+    'good', 'proficient', 'familiar', 'working', 'demonstrated',
+})
+
+
+# Separators for splitting skills
+SEPARATORS = (
+    ',', ';', '|', '/', '\\', '-', '–', '—',
+    '\n', '\t', '•', '·', '*', '>', '<',
+    '(', ')', '[', ']', '{', '}'
+)
+
+
+# Single or two-letter abbreviations that are still valid skills
+KNOWN_SHORT_ABBREVS = frozenset({
+    'r', 'c', 'ai', 'ml', 'bi', 'qa', 'ui', 'ux', 'hr', 'it', 'js', 'py',
+    'sql', 'api', 'aws', 'gcp', 'sap', 'erp', 'crm', 'ehr', 'emr', 'pos',
+    'cad', 'cpr', 'bls', 'acls', 'pals', 'nrp', 'aha', 'arrt', 'ascp',
+    'cpa', 'cma', 'rn', 'lpn', 'cna', 'bsn', 'msn', 'mba', 'phd', 'pe',
+    'pmp', 'cdl', 'ged', 'fsa', 'cms', 'dod', 'ppe', 'osha', 'hipaa'
+})
+
+
+# Common concatenated words
+SPACING_FIXES = {
+    'problemsolving': 'problem solving',
+    'decisionmaking': 'decision making',
+    'timemanagement': 'time management',
+    'projectmanagement': 'project management',
+    'customerservice': 'customer service',
+    'machinelearning': 'machine learning',
+    'deeplearning': 'deep learning',
+    'dataanalysis': 'data analysis',
+    'datascience': 'data science',
+    'softwareengineer': 'software engineer',
+    'webdevelopment': 'web development',
+    'frontenddevelopment': 'frontend development',
+    'backenddevelopment': 'backend development',
+    'fullstackdevelopment': 'full stack development',
+}
+
+
+# Skill normalizations (expand abbreviations, fix common issues)
+SKILL_NORMALIZATIONS = {
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'nlp': 'natural language processing',
+    'cv': 'computer vision',
+    'dl': 'deep learning',
+    'aws': 'amazon web services',
+    'gcp': 'google cloud platform',
+    'sql': 'sql',
+    'nosql': 'nosql',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'c++': 'c plus plus',
+    'c#': 'c sharp',
+    'devops': 'devops',
+    'ci/cd': 'continuous integration continuous deployment',
+    'cicd': 'continuous integration continuous deployment',
+    'k8s': 'kubernetes',
+    'crm': 'customer relationship management',
+    'erp': 'enterprise resource planning',
+    'api': 'api',
+    'rest': 'rest api',
+    'html': 'html',
+    'css': 'css',
+    'ui/ux': 'user interface user experience',
+    'b2b': 'business to business',
+    'b2c': 'business to consumer',
+    'kpi': 'key performance indicators',
+    'roi': 'return on investment',
+    'seo': 'search engine optimization',
+    'sem': 'search engine marketing',
+    'ppc': 'pay per click',
+    'rn': 'registered nurse',
+    'lpn': 'licensed practical nurse',
+    'cna': 'certified nursing assistant',
+    'cpr': 'cardiopulmonary resuscitation',
+    'bls': 'basic life support',
+    'acls': 'advanced cardiovascular life support',
+    'pmp': 'project management professional',
+    'scrum': 'scrum',
+    'agile': 'agile',
+    'lean': 'lean',
+    'six sigma': 'six sigma',
+    'iso': 'iso',
+    'osha': 'occupational safety and health administration',
+    'hipaa': 'health insurance portability and accountability act',
+    'gdpr': 'general data protection regulation',
+}
+
 
 class EnhancedSkillsCleaner:
     """Clean and normalize skills dataset with intelligent filtering"""
     
     def __init__(self):
-        # Common multi-word skills that should NOT be split
-        self.multi_word_skills = {
-            # Programming & Development
-            'machine learning', 'deep learning', 'natural language processing', 'computer vision',
-            'data science', 'data analysis', 'data analytics', 'data engineering', 'data mining',
-            'software development', 'web development', 'mobile development', 'full stack',
-            'front end', 'back end', 'frontend', 'backend', 'agile development', 
-            'object oriented programming', 'test driven development', 'continuous integration', 
-            'continuous deployment', 'version control', 'source control', 'code review',
-            
-            # Cloud & Infrastructure
-            'cloud computing', 'amazon web services', 'microsoft azure', 'google cloud',
-            'infrastructure as code', 'configuration management', 'containerization',
-            'cloud architecture', 'cloud security', 'devops', 'site reliability',
-            
-            # Business & Management
-            'project management', 'product management', 'business analysis', 'business intelligence',
-            'business development', 'strategic planning', 'change management', 'risk management',
-            'supply chain', 'supply chain management', 'inventory management', 'quality assurance',
-            'quality control', 'process improvement', 'continuous improvement', 'performance management',
-            'stakeholder management', 'vendor management', 'budget management', 'financial analysis',
-            'financial modeling', 'cost analysis', 'root cause analysis', 'gap analysis',
-            'account management', 'client management', 'relationship management',
-            
-            # Analytics & Statistics
-            'statistical analysis', 'predictive modeling', 'predictive analytics', 'time series',
-            'time series analysis', 'regression analysis', 'sentiment analysis', 'customer analytics',
-            'marketing analytics', 'web analytics', 'social media analytics', 'business analytics',
-            'data visualization', 'data warehousing', 'data governance',
-            
-            # Design & Creative
-            'user experience', 'user interface', 'graphic design', 'web design', 'ui design',
-            'ux design', 'visual design', 'interaction design', 'responsive design',
-            'ui ux', 'ux ui', 'product design', 'service design',
-            
-            # Soft Skills
-            'problem solving', 'critical thinking', 'analytical thinking', 'creative thinking',
-            'decision making', 'time management', 'stress management', 'conflict resolution',
-            'team building', 'public speaking', 'cross functional', 'customer service',
-            'interpersonal skills', 'communication skills', 'leadership skills', 'teamwork',
-            'attention to detail', 'organizational skills', 'multitasking',
-            
-            # Operations & Manufacturing
-            'operations management', 'process optimization', 'lean manufacturing', 'six sigma',
-            'total quality management', 'just in time', 'demand planning', 'capacity planning',
-            'production planning', 'resource planning', 'workforce planning', 'lean six sigma',
-            'kaizen', 'root cause', 'continuous improvement',
-            
-            # Frameworks & Tools
-            'spring boot', 'ruby on rails', 'entity framework', 'apache spark', 'big data',
-            'microsoft excel', 'microsoft office', 'google analytics', 'google sheets',
-            'power bi', 'sql server', 'visual studio', 'react native', 'node js',
-            
-            # Methodologies
-            'agile methodology', 'scrum methodology', 'waterfall methodology', 'kanban',
-            'design thinking', 'human centered design', 'agile scrum',
-            
-            # Healthcare & Safety
-            'patient care', 'emergency response', 'first aid', 'cpr', 'basic life support',
-            'advanced life support', 'infection control', 'medical terminology',
-            'electronic medical records', 'hipaa compliance',
-            
-            # Education & Certifications
-            'high school diploma', 'bachelor degree', 'master degree', 'phd', 'mba',
-            'associate degree', 'professional development', 'continuing education',
-            
-            # Sales & Marketing
-            'sales management', 'digital marketing', 'content marketing', 'email marketing',
-            'social media', 'social media marketing', 'search engine optimization', 'seo',
-            'search engine marketing', 'sem', 'pay per click', 'ppc', 'lead generation',
-            'customer relationship management', 'crm',
-            
-            # Finance & Accounting
-            'financial reporting', 'financial planning', 'accounts payable', 'accounts receivable',
-            'general ledger', 'cost accounting', 'tax preparation', 'financial statements',
-            'balance sheet', 'income statement', 'cash flow',
-            
-            # HR & Recruitment
-            'human resources', 'talent acquisition', 'employee relations', 'performance reviews',
-            'talent management', 'workforce management', 'compensation benefits',
-            'onboarding', 'talent development',
-            
-            # Legal & Compliance
-            'regulatory compliance', 'contract management', 'legal research', 'contract negotiation',
-            'intellectual property', 'employment law', 'corporate law',
-            
-            # Construction & Trades
-            'construction management', 'building codes', 'safety regulations', 'osha',
-            'construction safety', 'project scheduling', 'blueprint reading',
-            
-            # Hospitality & Service
-            'food safety', 'food service', 'customer satisfaction', 'guest services',
-            'restaurant management', 'hotel management', 'event planning',
-            
-            # Logistics & Transportation
-            'logistics management', 'transportation management', 'warehouse management',
-            'route planning', 'fleet management', 'distribution management',
-        }
-        
-        # Phrases that indicate NON-skill entries (job duties, requirements, etc.)
-        self.non_skill_phrases = {
-            'experience in', 'experience with', 'knowledge of', 'ability to',
-            'responsible for', 'duties include', 'years of', 'working with',
-            'familiarity with', 'understanding of', 'exposure to', 'comfortable with',
-            'skilled in', 'proficient in', 'expert in', 'background in',
-            'must have', 'should have', 'required to', 'able to', 'willing to',
-            'demonstrated ability', 'proven ability', 'strong knowledge',
-            'minimum of', 'at least', 'or more', 'or equivalent',
-            'post construction', 'site visits', 'compliance site', 'ground water',
-            'level iv', 'level iii', 'level ii', 'level i', 'grade',
-            'extra hours', 'working hours', 'shift work', 'overtime',
-            'repetitive', 'physically demanding', 'heavy lifting',
-            'transfer station', 'pumpage inventories', 'tenure and promotion',
-            'directory maintenance', 'recovery processes', 'testing service',
-        }
-        
-        # Generic/vague terms that aren't specific skills
-        self.vague_terms = {
-            'skills', 'knowledge', 'abilities', 'competencies', 'proficiencies',
-            'expertise', 'capabilities', 'qualifications', 'requirements',
-            'responsibilities', 'duties', 'tasks', 'activities', 'functions',
-            'operations', 'procedures', 'processes', 'methods', 'techniques',
-            'tools', 'systems', 'applications', 'platforms', 'technologies',
-            'programs', 'services', 'products', 'solutions', 'resources',
-            'materials', 'equipment', 'facilities', 'environment', 'setting',
-            'area', 'field', 'domain', 'industry', 'sector', 'market',
-            'business', 'company', 'organization', 'department', 'team',
-            'position', 'role', 'job', 'work', 'career', 'professional',
-            'certification', 'license', 'credential', 'diploma', 'certificate',
-            'training', 'education', 'degree', 'course', 'program', 'class',
-            'experience', 'optional', 'desirable', 'desired', 'preferred', 'required',
-            'if applicable', 'one', 'two', 'three', 'four', 'five',
-            'physical requirements', 'physical demands', 'physical ability', 'physical abilities',
-            'certifications', 'licensure', 'registration', 'software', 'system', 'standards',
-            'travel', 'lifting', 'management', 'compliance', 'applicable',
-            # Additional vague terms from data
-            'asset', 'benefits', 'pto', 'advantageous', 'plan', 'process',
-            'designation', 'bonus', 'clearance', 'if required', 'regulations',
-            'testing', 'design', 'analysis', 'documentation', 'guidelines',
-            'membership', 'programming', 'engineering', 'nursing', 'process',
-        }
-        
-        # Common noise words
-        self.noise_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'a', 'an', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
-            'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might',
-            'can', 'must', 'shall', 'about', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'between', 'under', 'again', 'further', 'then',
-            'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'both',
-            'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor',
-            'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'etc',
-            'i', 'you', 'he', 'she', 'it', 'we', 'they', 'them', 'their', 'this', 'that',
-            'including', 'required', 'preferred', 'plus', 'strong', 'excellent',
-            'good', 'proficient', 'familiar', 'working', 'demonstrated',
-        }
-        
-        # Separators for splitting skills
-        self.separators = [
-            ',', ';', '|', '/', '\\', '-', '–', '—',
-            '\n', '\t', '•', '·', '*', '>', '<',
-            '(', ')', '[', ']', '{', '}'
-        ]
-        
-        # Skill normalizations (expand abbreviations, fix common issues)
-        self.normalizations = {
-            'ml': 'machine learning',
-            'ai': 'artificial intelligence',
-            'nlp': 'natural language processing',
-            'cv': 'computer vision',
-            'dl': 'deep learning',
-            'aws': 'amazon web services',
-            'gcp': 'google cloud platform',
-            'sql': 'sql',
-            'nosql': 'nosql',
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'c++': 'c plus plus',
-            'c#': 'c sharp',
-            'devops': 'devops',
-            'ci/cd': 'continuous integration continuous deployment',
-            'cicd': 'continuous integration continuous deployment',
-            'k8s': 'kubernetes',
-            'crm': 'customer relationship management',
-            'erp': 'enterprise resource planning',
-            'api': 'api',
-            'rest': 'rest api',
-            'html': 'html',
-            'css': 'css',
-            'ui/ux': 'user interface user experience',
-            'b2b': 'business to business',
-            'b2c': 'business to consumer',
-            'kpi': 'key performance indicators',
-            'roi': 'return on investment',
-            'seo': 'search engine optimization',
-            'sem': 'search engine marketing',
-            'ppc': 'pay per click',
-            'rn': 'registered nurse',
-            'lpn': 'licensed practical nurse',
-            'cna': 'certified nursing assistant',
-            'cpr': 'cardiopulmonary resuscitation',
-            'bls': 'basic life support',
-            'acls': 'advanced cardiovascular life support',
-            'pmp': 'project management professional',
-            'scrum': 'scrum',
-            'agile': 'agile',
-            'lean': 'lean',
-            'six sigma': 'six sigma',
-            'iso': 'iso',
-            'osha': 'occupational safety and health administration',
-            'hipaa': 'health insurance portability and accountability act',
-            'gdpr': 'general data protection regulation',
-        }
+        # The vocabularies are module-level constants shared by all instances
+        self.multi_word_skills = MULTI_WORD_SKILLS
+        self.non_skill_phrases = NON_SKILL_PHRASES
+        self.vague_terms = VAGUE_TERMS
+        self.noise_words = NOISE_WORDS
+        self.separators = SEPARATORS
+        self.known_short_abbrevs = KNOWN_SHORT_ABBREVS
+        self.spacing_fixes = SPACING_FIXES
+        self.normalizations = SKILL_NORMALIZATIONS
+        
+        # normalize_skill and is_valid_skill are pure functions of their input and
+        # the exploded skills repeat a lot (also across the chunks a pool worker's
+        # cleaner sees): results are kept for the most recent VALID_SKILL_CACHE_SIZE strings
+        self.normalize_skill = lru_cache(maxsize=VALID_SKILL_CACHE_SIZE)(self.normalize_skill)
+        self.is_valid_skill = lru_cache(maxsize=VALID_SKILL_CACHE_SIZE)(self.is_valid_skill)
+        
+        # Terms rejected outright, as one set lookup
+        self._reject_terms = self.vague_terms | self.noise_words
+        
+        # str.translate table deleting ASCII digits (counts digits in one C call)
+        self._digit_killer = str.maketrans('', '', '0123456789')
+        
+        # All separators are single characters: split on one character class
+        self._sep_re = re.compile('[' + ''.join(re.escape(sep) for sep in self.separators) + ']')
+        
+        # Only multi-word skills containing a separator would be cut apart by the
+        # split; they are found in one scan (longest first) and protected
+        protected_skills = sorted(
+            (skill for skill in self.multi_word_skills if self._sep_re.search(skill)),
+            key=len, reverse=True
+        )
+        self._protected_skills_re = (
+            re.compile('|'.join(re.escape(skill) for skill in protected_skills))
+            if protected_skills else None
+        )
+        self._placeholder_re = re.compile(r'\x01(\d+)\x02')
+        
+        # Both the lowercase and the Title-case form of each concatenated word
+        self._spacing_map = {}
+        for concat, fixed in self.spacing_fixes.items():
+            self._spacing_map[concat] = fixed
+            self._spacing_map[concat.title()] = fixed.title()
+        self._spacing_re = re.compile(
+            '|'.join(re.escape(concat) for concat in sorted(self._spacing_map, key=len, reverse=True))
+        )
+        
+        # fix_spacing's apostrophe patterns
+        self._lone_s_re = re.compile(r'\s+s\s+')
+        self._s_degree_re = re.compile(r'\bs\s+(degree|diploma)')
+        
+        # All non-skill phrases as one alternation: a single scan of the skill
+        # instead of one substring search per phrase. It is literals only, so RE2
+        # (when installed) matches exactly like re, without backtracking
+        self._non_skill_re = (re2 or re).compile(
+            '|'.join(re.escape(phrase) for phrase in sorted(self.non_skill_phrases, key=len, reverse=True))
+        )
+        
+        # Patterns that reject a skill on any hit, compiled once and unioned so a
+        # single search() replaces one regex scan per check
+        self._reject_re = re.compile(
+            r'^\d{2,4}$'                                                  # Just a number or date
+            r'|\b(?:19|20)\d{2}\b'                                        # Year patterns (2020, 2021, etc.)
+            r'|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b'   # Date patterns
+            r'|[#@$%^&*<>{}[\]\\]'                                        # Special characters that indicate noise
+            r'|experience\s+\d+'                                          # "experience 5 years"
+            r'|^\d+\s*(?:years?|yrs?|months?)'                            # Starts with "5 years"
+            r'|\d+\+?\s*(?:years?|yrs?)'                                  # "2+ years", "3+ years"
+            r'|level\s+(?:i{1,3}|iv|v|1|2|3|4|5)'                         # Level indicators (level i, level ii, etc.)
+        )
         
     def is_valid_skill(self, skill: str) -> bool:
         """
@@ -241,87 +374,100 @@ class EnhancedSkillsCleaner:
         """
         skill_lower = skill.lower().strip()
         
+        # Cheapest checks first: most non-skills are rejected before any regex
+        
         # Too short or too long
         if len(skill_lower) < 2 or len(skill_lower) > 60:
             return False
         
-        # Just a number or date
-        if skill_lower.isdigit() or re.match(r'^\d{2,4}$', skill_lower):
-            return False
-        
-        # Contains year patterns (2020, 2021, etc.)
-        if re.search(r'\b(19|20)\d{2}\b', skill_lower):
-            return False
-        
-        # Contains date patterns
-        if re.search(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b', skill_lower):
+        # Just a vague term or noise word on its own
+        if skill_lower in self._reject_terms:
             return False
         
-        # Check for non-skill phrases
-        for phrase in self.non_skill_phrases:
-            if phrase in skill_lower:
-                return False
-        
-        # Just a vague term on its own
-        if skill_lower in self.vague_terms:
-            return False
-        
-        # Just a noise word
-        if skill_lower in self.noise_words:
+        # Single or two-letter abbreviations are too ambiguous (except known ones)
+        if len(skill_lower) <= 2 and skill_lower not in self.known_short_abbrevs:
             return False
         
-        # Too many numbers (likely a code or ID)
-        if sum(c.isdigit() for c in skill_lower) > len(skill_lower) * 0.3:
+        # Just a number
+        if skill_lower.isdigit():
             return False
         
-        # Contains special characters that indicate noise
-        if re.search(r'[#@$%^&*<>{}[\]\\]', skill_lower):
+        # Too many numbers (likely a code or ID): more than 30% digits
+        n_digits = len(skill_lower) - len(skill_lower.translate(self._digit_killer))
+        if n_digits * 10 > len(skill_lower) * 3:
             return False
         
         # Looks like an email or URL
         if '@' in skill_lower or 'www.' in skill_lower or 'http' in skill_lower:
             return False
         
-        # Contains "experience" followed by number (e.g., "experience 5 years")
-        if re.search(r'experience\s+\d+', skill_lower):
-            return False
-        
-        # Starts with number followed by "years" or "year"
-        if re.match(r'^\d+\s*(years?|yrs?|months?)', skill_lower):
-            return False
-        
-        # Contains "+ years" pattern (e.g., "2+ years", "3+ years")
-        if re.search(r'\d+\+?\s*(years?|yrs?)', skill_lower):
-            return False
-        
-        # Contains level indicators (level i, level ii, etc.)
-        if re.search(r'level\s+(i{1,3}|iv|v|1|2|3|4|5)', skill_lower):
-            return False
-        
         # Too many words (likely a sentence or description)
         word_count = len(skill_lower.split())
         if word_count > 8:
             return False
         
-        # Single or two-letter abbreviations are too ambiguous (except known ones)
-        known_short_abbrevs = {
-            'r', 'c', 'ai', 'ml', 'bi', 'qa', 'ui', 'ux', 'hr', 'it', 'js', 'py',
-            'sql', 'api', 'aws', 'gcp', 'sap', 'erp', 'crm', 'ehr', 'emr', 'pos',
-            'cad', 'cpr', 'bls', 'acls', 'pals', 'nrp', 'aha', 'arrt', 'ascp',
-            'cpa', 'cma', 'rn', 'lpn', 'cna', 'bsn', 'msn', 'mba', 'phd', 'pe',
-            'pmp', 'cdl', 'ged', 'fsa', 'cms', 'dod', 'ppe', 'osha', 'hipaa'
-        }
-        if len(skill_lower) <= 2 and skill_lower not in known_short_abbrevs:
-            return False
-        
         # Contains "or" or "and" connecting unrelated things
         if word_count > 4 and (' or ' in skill_lower or ' and ' in skill_lower):
             # Exception: known multi-word skills
             if skill_lower not in self.multi_word_skills:
                 return False
         
+        # Dates, years, durations, level indicators and noise characters
+        if self._reject_re.search(skill_lower):
+            return False
+        
+        # Check for non-skill phrases
+        if self._non_skill_re.search(skill_lower):
+            return False
+        
         return True
     
+    def valid_skill_mask(self, skills: pd.Series) -> pd.Series:
+        """
+        Vectorized is_valid_skill: the same checks as whole-column string ops
+        
+        Args:
+            skills: Series of skill strings
+            
+        Returns:
+            Boolean Series, True where the skill is valid
+        """
+        if ARROW_STRING_DTYPE is None:
+            return skills.map(self.is_valid_skill).astype(bool)
+        
+        skills = skills.astype(ARROW_STRING_DTYPE)
+        
+        # On printable-ASCII skills Arrow's regex kernels (RE2) agree with Python's
+        # re (\b, \d and \s are ASCII there anyway); other skills are validated
+        # one by one with is_valid_skill
+        is_simple = skills.str.fullmatch(r'[\x20-\x7e]*').fillna(False).to_numpy(dtype=bool)
+        
+        simple_skills = skills[is_simple].str.lower().str.strip()
+        length = simple_skills.str.len()
+        word_count = simple_skills.str.count(' +') + 1
+        
+        # Too short or too long, just a number, vague term or noise word
+        simple_mask = length.between(2, 60) & ~simple_skills.str.isdigit()
+        simple_mask &= ~simple_skills.isin(self._reject_terms)
+        
+        # Short abbreviations, sentences and "x or y" descriptions
+        simple_mask &= (length > 2) | simple_skills.isin(self.known_short_abbrevs)
+        simple_mask &= word_count <= 8
+        simple_mask &= ~((word_count > 4) & simple_skills.str.contains(' or | and ')
+                         & ~simple_skills.isin(self.multi_word_skills))
+        
+        # Too many numbers, emails/URLs, non-skill phrases and reject patterns
+        simple_mask &= simple_skills.str.count('[0-9]') * 10 <= length * 3
+        simple_mask &= ~simple_skills.str.contains(r'@|www\.|http')
+        simple_mask &= ~simple_skills.str.contains(self._non_skill_re.pattern)
+        simple_mask &= ~simple_skills.str.contains(self._reject_re.pattern)
+        
+        mask = np.zeros(len(skills), dtype=bool)
+        mask[is_simple] = simple_mask.to_numpy(dtype=bool)
+        mask[~is_simple] = [self.is_valid_skill(skill) for skill in skills[~is_simple]]
+        
+        return pd.Series(mask, index=skills.index)
+    
     def fix_spacing(self, skill: str) -> str:
         """
         Fix common spacing issues in skills
@@ -332,40 +478,27 @@ class EnhancedSkillsCleaner:
         Returns:
             Fixed skill text
         """
-        # Common concatenated words
-        spacing_fixes = {
-            'problemsolving': 'problem solving',
-            'decisionmaking': 'decision making',
-            'timemanagement': 'time management',
-            'projectmanagement': 'project management',
-            'customerservice': 'customer service',
-            'machinelearning': 'machine learning',
-            'deeplearning': 'deep learning',
-            'dataanalysis': 'data analysis',
-            'datascience': 'data science',
-            'softwareengineer': 'software engineer',
-            'webdevelopment': 'web development',
-            'frontenddevelopment': 'frontend development',
-            'backenddevelopment': 'backend development',
-            'fullstackdevelopment': 'full stack development',
-        }
-        
-        skill_lower = skill.lower()
-        for concat, fixed in spacing_fixes.items():
-            if concat in skill_lower:
-                skill = skill.replace(concat, fixed).replace(concat.title(), fixed.title())
+        # Concatenated words (lowercase or Title case), fixed in one regex pass
+        skill = self._spacing_re.sub(self._fix_concatenated, skill)
         
         # Fix double apostrophes (bachelor''s -> bachelor's)
         skill = skill.replace("''", "'")
         
         # Fix apostrophes
-        skill = re.sub(r'\s+s\s+', "'s ", skill)  # "bachelor s degree" -> "bachelor's degree"
-        skill = re.sub(r'\bs\s+(degree|diploma)', r"'s \1", skill)
+        skill = self._lone_s_re.sub("'s ", skill)  # "bachelor s degree" -> "bachelor's degree"
+        skill = self._s_degree_re.sub(r"'s \1", skill)
         
-        # Fix multiple spaces
-        skill = re.sub(r'\s+', ' ', skill)
+        # ...and the double apostrophes the fixes above create ("bachelor's degree"
+        # -> "bachelor''s degree"), so no separate pass over the output is needed
+        skill = skill.replace("''", "'")
         
-        return skill.strip()
+        # Fix multiple spaces (str.split() splits on the same whitespace as \s+
+        # and drops the ends, so this also strips)
+        return ' '.join(skill.split())
+    
+    def _fix_concatenated(self, match: re.Match) -> str:
+        """Replacement for a _spacing_re match"""
+        return self._spacing_map[match.group(0)]
     
     def clean_text(self, text: str) -> str:
         """
@@ -383,13 +516,8 @@ class EnhancedSkillsCleaner:
         # Convert to lowercase
         text = text.lower()
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        
-        return text
+        # Remove extra and leading/trailing whitespace, without a regex pass
+        return ' '.join(text.split())
     
     def split_skills(self, text: str) -> List[str]:
         """
@@ -404,25 +532,32 @@ class EnhancedSkillsCleaner:
         if not text:
             return []
         
-        # First, protect multi-word skills by replacing spaces with placeholders
-        protected_text = text
-        placeholder_map = {}
+        # No multi-word skill with a separator in it (in the vocabulary or in this
+        # text): a plain split keeps every skill intact
+        if self._protected_skills_re is None or not self._protected_skills_re.search(text):
+            return [skill.strip() for skill in self._sep_re.split(text) if skill.strip()]
+        
+        # First, protect multi-word skills by replacing them with "\x01<index>\x02"
+        # placeholders (no separator or regular text uses these characters)
+        originals = []
         
-        for i, multi_word in enumerate(sorted(self.multi_word_skills, key=len, reverse=True)):
-            if multi_word in protected_text:
-                placeholder = f"__MULTIWORD_{i}__"
-                placeholder_map[placeholder] = multi_word
-                protected_text = protected_text.replace(multi_word, placeholder)
+        def protect(match):
+            originals.append(match.group(0))
+            return f"\x01{len(originals) - 1}\x02"
+        
+        protected_text = self._protected_skills_re.sub(protect, text)
         
         # Now split by separators
-        pattern = '|'.join(re.escape(sep) for sep in self.separators)
-        skills = re.split(pattern, protected_text)
+        skills = self._sep_re.split(protected_text)
+        
+        # Restore multi-word skills with one substitution per piece
+        def restore(match):
+            return originals[int(match.group(1))]
         
-        # Restore multi-word skills
         restored_skills = []
         for skill in skills:
-            for placeholder, original in placeholder_map.items():
-                skill = skill.replace(placeholder, original)
+            if '\x01' in skill:
+                skill = self._placeholder_re.sub(restore, skill)
             if skill.strip():
                 restored_skills.append(skill.strip())
         
@@ -447,62 +582,100 @@ class EnhancedSkillsCleaner:
         if skill_lower in self.normalizations:
             return self.normalizations[skill_lower]
         
-        return skill_lower
+        # Many raw spellings normalize to the same skill: interned, the cached
+        # results and the counts share one string object per skill
+        return sys.intern(skill_lower)
     
-    def clean_dataframe(self, df: pd.DataFrame, column_name: str) -> pd.DataFrame:
+    def count_skills(self, df: pd.DataFrame, column_name: str, verbose: bool = True) -> Counter:
         """
-        Clean the entire dataframe
+        Clean, split, validate and normalize the skills of a dataframe and count them
         
         Args:
             df: DataFrame with skills data
             column_name: Name of column containing skills
+            verbose: Print progress for each step
             
         Returns:
-            Cleaned DataFrame
+            Counter of normalized skill -> number of mentions (in first-seen order)
         """
-        print(f"📊 Starting with {len(df)} rows")
+        log = print if verbose else (lambda *args, **kwargs: None)
+        log(f"📊 Starting with {len(df)} rows")
         
         # Step 1: Clean text
-        print("🧹 Cleaning text...")
+        log("🧹 Cleaning text...")
         df['cleaned'] = df[column_name].apply(self.clean_text)
         
         # Step 2: Split skills
-        print("✂️ Splitting skills while preserving multi-word skills...")
+        log("✂️ Splitting skills while preserving multi-word skills...")
         df['skills_list'] = df['cleaned'].apply(self.split_skills)
         
         # Step 3: Explode into individual skills
-        print("💥 Exploding into individual skills...")
+        log("💥 Exploding into individual skills...")
         df_exploded = df.explode('skills_list')
+        if ARROW_STRING_DTYPE is not None:
+            # Arrow-backed strings: the filters, value_counts and drop_duplicates
+            # below run in Arrow's C++ kernels instead of over Python objects
+            df_exploded['skills_list'] = df_exploded['skills_list'].astype(ARROW_STRING_DTYPE)
         df_exploded = df_exploded[df_exploded['skills_list'].notna()]
         df_exploded = df_exploded[df_exploded['skills_list'] != '']
         
-        print(f"   Before filtering: {len(df_exploded)} skills")
+        log(f"   Before filtering: {len(df_exploded)} skills")
         
-        # Step 4: Validate skills (remove non-skills)
-        print("🔍 Filtering out non-skills (job duties, requirements, etc.)...")
-        df_exploded = df_exploded[df_exploded['skills_list'].apply(self.is_valid_skill)]
-        print(f"   After filtering: {len(df_exploded)} valid skills")
+        # Step 4: Validate skills (remove non-skills). The skills are dictionary-
+        # encoded (factorize) first: each distinct string is validated and then
+        # normalized once, and mentions are carried as integer codes
+        log("🔍 Filtering out non-skills (job duties, requirements, etc.)...")
+        codes, uniques = pd.factorize(df_exploded['skills_list'])
+        valid = self.valid_skill_mask(pd.Series(uniques)).to_numpy(dtype=bool)
+        codes = codes[valid[codes]]
+        log(f"   After filtering: {len(codes)} valid skills")
         
         # Step 5: Normalize skill names
-        print("🔄 Normalizing skill names (expanding abbreviations, fixing spacing)...")
-        df_exploded['skill'] = df_exploded['skills_list'].apply(self.normalize_skill)
+        log("🔄 Normalizing skill names (expanding abbreviations, fixing spacing)...")
+        normalized = np.array([self.normalize_skill(skill) for skill in uniques[valid]], dtype=object)
+        skill_codes, skills = pd.factorize(normalized)
+        
+        # Count each skill's frequency (also deduplicates)
+        unique_skill_codes = np.full(len(uniques), -1, dtype=skill_codes.dtype)
+        unique_skill_codes[valid] = skill_codes
+        counts = np.bincount(unique_skill_codes[codes], minlength=len(skills))
+        return Counter(dict(zip(skills.tolist(), counts.tolist())))
+    
+    @staticmethod
+    def skill_counts_to_dataframe(skill_counts: Counter) -> pd.DataFrame:
+        """
+        Build the cleaned skills table from skill counts
         
-        # Calculate frequencies BEFORE deduplication
-        print("📊 Calculating skill frequencies...")
-        skill_counts = df_exploded['skill'].value_counts()
+        Args:
+            skill_counts: Counter of skill -> number of mentions
+            
+        Returns:
+            DataFrame with 'skill' and 'frequency' columns, most frequent first
+        """
+        # most_common sorts stably: ties keep their first-seen order
+        return pd.DataFrame(skill_counts.most_common(), columns=['skill', 'frequency'])
+    
+    def clean_dataframe(self, df: pd.DataFrame, column_name: str) -> pd.DataFrame:
+        """
+        Clean the entire dataframe
         
-        # Step 6: Remove duplicates
-        print("🗑️ Removing duplicates...")
-        print(f"   Before deduplication: {len(df_exploded)} skills")
-        df_clean = df_exploded[['skill']].drop_duplicates()
-        print(f"   After deduplication: {len(df_clean)} unique skills")
-        print(f"   Removed {len(df_exploded) - len(df_clean)} duplicates")
+        Args:
+            df: DataFrame with skills data
+            column_name: Name of column containing skills
+            
+        Returns:
+            Cleaned DataFrame
+        """
+        skill_counts = self.count_skills(df, column_name)
         
-        # Add frequency counts
-        df_clean['frequency'] = df_clean['skill'].map(skill_counts)
-        df_clean = df_clean.sort_values('frequency', ascending=False).reset_index(drop=True)
+        # Step 6: Remove duplicates (the counts already hold one entry per skill)
+        total_mentions = sum(skill_counts.values())
+        print("🗑️ Removing duplicates and calculating skill frequencies...")
+        print(f"   Before deduplication: {total_mentions} skills")
+        print(f"   After deduplication: {len(skill_counts)} unique skills")
+        print(f"   Removed {total_mentions - len(skill_counts)} duplicates")
         
-        return df_clean
+        return self.skill_counts_to_dataframe(skill_counts)
     
     def filter_by_frequency(self, df: pd.DataFrame, min_freq: int = 2) -> pd.DataFrame:
         """
@@ -524,6 +697,52 @@ class EnhancedSkillsCleaner:
         return df_filtered
 
 
+# Per-process cleaner of the chunk workers
+_worker_cleaner = None
+
+
+def _init_worker():
+    """Build the worker process's cleaner (and its compiled patterns) once"""
+    global _worker_cleaner
+    _worker_cleaner = EnhancedSkillsCleaner()
+
+
+def _count_chunk(chunk: pd.DataFrame, column_name: str) -> Counter:
+    return _worker_cleaner.count_skills(chunk, column_name, verbose=False)
+
+
+def count_chunks(chunks: Iterable[pd.DataFrame], column_name: str,
+                 workers: int = WORKERS) -> Iterator[Tuple[int, Counter]]:
+    """
+    Count the skills of each chunk, in a process pool when workers > 1
+    
+    Args:
+        chunks: DataFrames with skills data (e.g. pd.read_csv(..., chunksize=...))
+        column_name: Name of column containing skills
+        workers: Number of worker processes
+        
+    Yields:
+        (number of rows, EnhancedSkillsCleaner.count_skills result) per chunk, in input order
+    """
+    if workers <= 1:
+        cleaner = EnhancedSkillsCleaner()
+        for chunk in chunks:
+            yield len(chunk), cleaner.count_skills(chunk, column_name, verbose=False)
+        return
+    
+    # At most two chunks per worker are read ahead, so memory stays bounded
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), executor.submit(_count_chunk, chunk, column_name)))
+            if len(pending) >= 2 * workers:
+                rows, future = pending.popleft()
+                yield rows, future.result()
+        while pending:
+            rows, future = pending.popleft()
+            yield rows, future.result()
+
+
 def main():
     """Main execution function"""
     print("=" * 80)
@@ -535,40 +754,51 @@ def main():
     output_file = 'data/skills_cleaned_v2.csv'
     stats_file = 'data/skills_statistics_v2.csv'
     
-    # Load data
+    # Peek at the header and a few rows; the full file is streamed in chunks below
     print(f"\n📂 Loading data from: {input_file}")
-    df = pd.read_csv(input_file)
-    print(f"✅ Loaded {len(df)} rows")
+    df_head = pd.read_csv(input_file, nrows=5)
     
-    print(f"\n📋 Columns: {df.columns.tolist()}")
+    print(f"\n📋 Columns: {df_head.columns.tolist()}")
     
     # Determine which column contains skills
     skill_column = None
-    for col in df.columns:
+    for col in df_head.columns:
         if 'skill' in col.lower():
             skill_column = col
             break
     
     if skill_column is None:
-        skill_column = df.columns[0]
+        skill_column = df_head.columns[0]
         print(f"⚠️ No 'skill' column found, using first column: '{skill_column}'")
     else:
         print(f"🎯 Using column: '{skill_column}'")
     
     # Show sample
     print(f"\n📝 Sample raw data:")
-    print(df[skill_column].head(3).tolist())
+    print(df_head[skill_column].head(3).tolist())
     
     # Clean the data
     print(f"\n{'=' * 80}")
     print("🚀 STARTING CLEANING PROCESS")
     print(f"{'=' * 80}\n")
     
-    cleaner = EnhancedSkillsCleaner()
-    df_clean = cleaner.clean_dataframe(df, skill_column)
+    # Chunks are cleaned by WORKERS processes; only a few chunks of rows (plus
+    # the running counts) are in memory at a time
+    print(f"⚙️ Cleaning {CHUNK_SIZE:,}-row chunks with {WORKERS} worker(s)...")
+    skill_counts = Counter()
+    total_rows = 0
+    chunks = pd.read_csv(input_file, usecols=[skill_column], chunksize=CHUNK_SIZE)
+    for chunk_num, (rows, chunk_counts) in enumerate(count_chunks(chunks, skill_column), 1):
+        skill_counts.update(chunk_counts)
+        total_rows += rows
+        print(f"   ✓ Chunk {chunk_num}: {total_rows:,} rows processed, "
+              f"{len(skill_counts):,} unique skills so far")
+    
+    print(f"\n✅ Loaded {total_rows} rows")
+    df_clean = EnhancedSkillsCleaner.skill_counts_to_dataframe(skill_counts)
     
     # Optional: Filter by frequency (uncomment to use)
-    # df_clean = cleaner.filter_by_frequency(df_clean, min_freq=2)
+    # df_clean = EnhancedSkillsCleaner().filter_by_frequency(df_clean, min_freq=2)
     
     # Generate statistics
     print(f"\n{'=' * 80}")
@@ -594,9 +824,6 @@ def main():
     print("💾 SAVING RESULTS")
     print(f"{'=' * 80}\n")
     
-    # Fix double apostrophes before saving
-    df_clean['skill'] = df_clean['skill'].str.replace("''", "'", regex=False)
-    
     df_clean.to_csv(output_file, index=False)
     print(f"✅ Saved cleaned skills to: {output_file}")
     print(f"   (includes frequency counts)")
@@ -606,9 +833,9 @@ def main():
     print(f"{'=' * 80}\n")
     
     print(f"📊 Summary:")
-    print(f"   • Input: {len(df):,} rows")
+    print(f"   • Input: {total_rows:,} rows")
     print(f"   • Output: {len(df_clean):,} unique clean skills")
-    print(f"   • Reduction: {((len(df) - len(df_clean)) / len(df) * 100):.1f}%")
+    print(f"   • Reduction: {((total_rows - len(df_clean)) / total_rows * 100):.1f}%")
 
 
 if __name__ == "__main__":
@@ -3,11 +3,28 @@ AI-Assisted Skills Cleaner - Final Pass
 Removes remaining non-skills identified through review
 """
 
+import os
 import pandas as pd
 import re
+from typing import List, Tuple
+
+try:
+    # Arrow-backed columns, so the filters run in Arrow's string kernels, and
+    # Arrow's CSV writer (optional). pandas' pyarrow engine cannot stream chunks:
+    # the C parser fills the Arrow arrays. Skill frequencies (mention counts)
+    # fit in 32 bits, half the memory of the default int64
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    READ_CSV_OPTIONS = {'dtype_backend': 'pyarrow', 'dtype': {'frequency': 'int32[pyarrow]'}}
+except ImportError:
+    pa = pacsv = None
+    READ_CSV_OPTIONS = {'dtype': {'frequency': 'int32'}}
+
+# Rows of the skills CSV filtered at a time (bounds memory on large inputs)
+CHUNK_SIZE = int(os.environ.get("ATS_FINAL_CHUNK_SIZE", "200000"))
 
 # US States (locations, not skills)
-US_STATES = {
+US_STATES = frozenset({
     'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado',
     'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho',
     'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana',
@@ -18,10 +35,22 @@ US_STATES = {
     'pennsylvania', 'rhode island', 'south carolina', 'south dakota',
     'tennessee', 'texas', 'utah', 'vermont', 'virginia', 'washington',
     'west virginia', 'wisconsin', 'wyoming'
-}
+})
+
+# US state abbreviations
+US_STATE_ABBREVS = frozenset({
+    'al', 'ak', 'az', 'ar', 'ca', 'co', 'ct', 'de', 'fl', 'ga', 'hi', 'id',
+    'il', 'in', 'ia', 'ks', 'ky', 'la', 'me', 'md', 'ma', 'mi', 'mn', 'ms',
+    'mo', 'mt', 'ne', 'nv', 'nh', 'nj', 'nm', 'ny', 'nc', 'nd', 'oh', 'ok',
+    'or', 'pa', 'ri', 'sc', 'sd', 'tn', 'tx', 'ut', 'vt', 'va', 'wa', 'wv',
+    'wi', 'wy'
+})
 
-# Additional non-skills to remove
-NON_SKILLS_TO_REMOVE = {
+# Every location, as one lookup
+LOCATIONS = US_STATES | US_STATE_ABBREVS
+
+# Additional non-skills to remove (lowercase, matched against lowercased skills)
+NON_SKILLS_TO_REMOVE = frozenset({
     # Benefits
     'paid time off', 'pto', 'vision', 'insurance', 'retirement plan',
     'eap', 'hsa', 'fsa', 'flexible schedule', 'vacation',
@@ -54,43 +83,45 @@ NON_SKILLS_TO_REMOVE = {
     
     # Duplicates with formatting issues
     "bachelor''s degree",  # Has double apostrophe - already have bachelor's degree
-}
+})
+
+
+# Substrings that mark a benefit or employment term
+BENEFIT_KEYWORDS = (
+    'time off', 'insurance', 'benefit', 'retirement', 'pension',
+    'vacation', 'holiday', 'pto', 'sick', 'leave', 'bonus',
+    'schedule', 'shift', 'hours', 'fulltime', 'full time',
+    'part time', 'parttime', 'contract', 'temporary', 'permanent'
+)
+
+# Single generic words
+GENERIC_WORDS = frozenset({
+    'helpful', 'minimum', 'maximum', 'doe', 'availability',
+    'experience', 'development', 'technology', 'reporting',
+    'projects', 'policies', 'plans', 'medical', 'qualification',
+    'accreditation', 'licensing', 'vaccination', 'standing',
+    'advanced', 'intermediate', 'basic', 'vision'
+})
+
+# Substrings that mark a requirement phrase
+REQUIREMENT_PHRASES = (
+    'not required', 'if required', 'an asset', 'a plus',
+    'preferred', 'required', 'optional', 'desirable'
+)
+
+# Each substring rule as one alternation (longest first): a single scan per skill
+BENEFIT_RE = re.compile('|'.join(re.escape(keyword) for keyword in sorted(BENEFIT_KEYWORDS, key=len, reverse=True)))
+REQUIREMENT_RE = re.compile('|'.join(re.escape(phrase) for phrase in sorted(REQUIREMENT_PHRASES, key=len, reverse=True)))
 
 def is_location(skill: str) -> bool:
     """Check if skill is a location (state, country, etc.)"""
-    skill_lower = skill.lower().strip()
-    
-    # US States
-    if skill_lower in US_STATES:
-        return True
-    
-    # State abbreviations (but exclude valid skills)
-    valid_abbrevs = {
-        'sql', 'api', 'aws', 'gcp', 'sap', 'erp', 'crm', 'ehr', 'emr', 
-        'cad', 'qa', 'ml', 'ai', 'bi', 'ui', 'ux', 'hr', 'it'
-    }
-    if len(skill_lower) == 2 and skill_lower not in valid_abbrevs:
-        # Could be state abbreviation
-        return True
-    
-    return False
+    return skill.lower().strip() in LOCATIONS
 
 def is_benefit_or_employment_term(skill: str) -> bool:
     """Check if skill is actually a benefit or employment term"""
     skill_lower = skill.lower().strip()
     
-    benefit_keywords = [
-        'time off', 'insurance', 'benefit', 'retirement', 'pension',
-        'vacation', 'holiday', 'pto', 'sick', 'leave', 'bonus',
-        'schedule', 'shift', 'hours', 'fulltime', 'full time',
-        'part time', 'parttime', 'contract', 'temporary', 'permanent'
-    ]
-    
-    for keyword in benefit_keywords:
-        if keyword in skill_lower:
-            return True
-    
-    return False
+    return BENEFIT_RE.search(skill_lower) is not None
 
 def is_generic_term(skill: str) -> bool:
     """Check if skill is too generic"""
@@ -101,28 +132,106 @@ def is_generic_term(skill: str) -> bool:
         return True
     
     # Single generic words
-    generic_words = {
-        'helpful', 'minimum', 'maximum', 'doe', 'availability',
-        'experience', 'development', 'technology', 'reporting',
-        'projects', 'policies', 'plans', 'medical', 'qualification',
-        'accreditation', 'licensing', 'vaccination', 'standing',
-        'advanced', 'intermediate', 'basic', 'vision'
-    }
-    
-    if skill_lower in generic_words:
+    if skill_lower in GENERIC_WORDS:
         return True
     
     # Requirement phrases
-    requirement_phrases = [
-        'not required', 'if required', 'an asset', 'a plus',
-        'preferred', 'required', 'optional', 'desirable'
-    ]
+    return REQUIREMENT_RE.search(skill_lower) is not None
+
+def location_mask(skills: pd.Series) -> pd.Series:
+    """
+    Vectorized is_location over a lowercased, stripped skill column
     
-    for phrase in requirement_phrases:
-        if phrase in skill_lower:
-            return True
+    Args:
+        skills: Lowercased and stripped skills
+        
+    Returns:
+        Boolean Series, True where the skill is a location
+    """
+    return skills.isin(LOCATIONS)
+
+def benefit_or_employment_mask(skills: pd.Series) -> pd.Series:
+    """
+    Vectorized is_benefit_or_employment_term over a lowercased, stripped skill column
     
-    return False
+    Args:
+        skills: Lowercased and stripped skills
+        
+    Returns:
+        Boolean Series, True where the skill is a benefit or employment term
+    """
+    return skills.str.contains(BENEFIT_RE.pattern, regex=True, na=False)
+
+def generic_term_mask(skills: pd.Series) -> pd.Series:
+    """
+    Vectorized is_generic_term over a lowercased, stripped skill column
+    
+    Args:
+        skills: Lowercased and stripped skills
+        
+    Returns:
+        Boolean Series, True where the skill is too generic
+    """
+    # Just a number below 20
+    numbers = pd.to_numeric(skills.where(skills.str.fullmatch('[0-9]+', na=False)), errors='coerce')
+    is_small_number = (numbers < 20).fillna(False)
+    
+    return (
+        is_small_number
+        | skills.isin(GENERIC_WORDS)
+        | skills.str.contains(REQUIREMENT_RE.pattern, regex=True, na=False)
+    )
+
+# Filter stages, in order: (progress message, report label)
+FILTER_STAGES = (
+    ("🗑️ Removing explicit non-skills...", "explicit non-skills"),
+    ("🌍 Removing locations (states, countries)...", "locations"),
+    ("💼 Removing benefits and employment terms...", "benefits/employment terms"),
+    ("🔍 Removing generic/vague terms...", "generic terms"),
+    ("🧹 Final cleanup...", "invalid entries"),
+)
+
+def filter_skills(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[int]]:
+    """
+    Remove the non-skills from (a chunk of) the skills table
+    
+    Args:
+        df: DataFrame with 'skill' and 'frequency' columns
+        
+    Returns:
+        Tuple of (remaining rows, rows removed by each of FILTER_STAGES)
+    """
+    # Lowercase and strip the skills once for the vectorized filters below
+    skills = df['skill'].str.lower().str.strip()
+    
+    # Every stage's mask is computed over the whole column and the dataframe is
+    # filtered once; a skill is counted under the first stage that removes it
+    masks = [
+        skills.isin(NON_SKILLS_TO_REMOVE),
+        location_mask(skills),
+        benefit_or_employment_mask(skills),
+        generic_term_mask(skills),
+        # Final cleanup: missing, empty or very short entries
+        ~skills.str.len().ge(2).fillna(False),
+    ]
+    removed = pd.Series(False, index=df.index)
+    removed_counts = []
+    for mask in masks:
+        mask = mask & ~removed
+        removed_counts.append(int(mask.sum()))
+        removed |= mask
+    df = df[~removed]
+    
+    return df, removed_counts
+
+def write_skills_csv(df: pd.DataFrame, output_file: str):
+    """Write the skills table as CSV (with Arrow's multithreaded writer when available)"""
+    if pacsv is None:
+        df.to_csv(output_file, index=False)
+        return
+    
+    # Arrow-backed columns convert without copying
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_file)
 
 def clean_skills_final_pass(input_file: str, output_file: str):
     """
@@ -136,50 +245,33 @@ def clean_skills_final_pass(input_file: str, output_file: str):
     print("AI-ASSISTED SKILLS CLEANER - FINAL PASS")
     print("=" * 80)
     
-    # Load data
+    # Load and filter the data chunk by chunk (every filter is row-local)
     print(f"\n📂 Loading: {input_file}")
-    df = pd.read_csv(input_file)
-    print(f"✅ Loaded {len(df):,} skills")
-    
-    initial_count = len(df)
-    
-    # Remove explicit non-skills
-    print(f"\n🗑️ Removing explicit non-skills...")
-    df = df[~df['skill'].isin(NON_SKILLS_TO_REMOVE)]
-    print(f"   Removed {initial_count - len(df):,} explicit non-skills")
-    
-    # Remove locations
-    print(f"\n🌍 Removing locations (states, countries)...")
-    before = len(df)
-    df = df[~df['skill'].apply(is_location)]
-    print(f"   Removed {before - len(df):,} locations")
-    
-    # Remove benefits/employment terms
-    print(f"\n💼 Removing benefits and employment terms...")
-    before = len(df)
-    df = df[~df['skill'].apply(is_benefit_or_employment_term)]
-    print(f"   Removed {before - len(df):,} benefits/employment terms")
-    
-    # Remove generic terms
-    print(f"\n🔍 Removing generic/vague terms...")
-    before = len(df)
-    df = df[~df['skill'].apply(is_generic_term)]
-    print(f"   Removed {before - len(df):,} generic terms")
-    
-    # Final cleanup: ensure no empty or very short entries
-    print(f"\n🧹 Final cleanup...")
-    before = len(df)
-    df = df[df['skill'].str.len() >= 2]
-    df = df[df['skill'].notna()]
-    df = df[df['skill'] != '']
-    print(f"   Removed {before - len(df):,} invalid entries")
-    
-    # Sort by frequency
-    df = df.sort_values('frequency', ascending=False).reset_index(drop=True)
+    initial_count = 0
+    kept_chunks = []
+    removed_counts = [0] * len(FILTER_STAGES)
+    for chunk in pd.read_csv(input_file, chunksize=CHUNK_SIZE, **READ_CSV_OPTIONS):
+        initial_count += len(chunk)
+        chunk, chunk_removed = filter_skills(chunk)
+        kept_chunks.append(chunk)
+        removed_counts = [total + removed for total, removed in zip(removed_counts, chunk_removed)]
+    df = pd.concat(kept_chunks, ignore_index=True)
+    print(f"✅ Loaded {initial_count:,} skills")
+    
+    for (message, label), removed in zip(FILTER_STAGES, removed_counts):
+        print(f"\n{message}")
+        print(f"   Removed {removed:,} {label}")
+    
+    # Sort by frequency (stable: equally frequent skills keep their input order
+    # whichever dtype backend the column uses). The v2 cleaner already writes
+    # the most frequent skills first and the filters keep row order, so an O(n)
+    # check usually replaces the O(n log n) sort
+    if not df['frequency'].is_monotonic_decreasing:
+        df = df.sort_values('frequency', ascending=False, kind='stable', ignore_index=True)
     
     # Save
     print(f"\n💾 Saving: {output_file}")
-    df.to_csv(output_file, index=False)
+    write_skills_csv(df, output_file)
     
     print(f"\n{'=' * 80}")
     print("✅ FINAL PASS COMPLETE")
@@ -191,8 +283,10 @@ def clean_skills_final_pass(input_file: str, output_file: str):
     print(f"   • Removed: {initial_count - len(df):,} non-skills ({(initial_count - len(df)) / initial_count * 100:.1f}%)")
     
     print(f"\n🔝 Top 30 final skills:")
-    for i in range(min(30, len(df))):
-        print(f"   {i+1:2d}. [{df.iloc[i]['frequency']:4d}x] {df.iloc[i]['skill']}")
+    # df is sorted by frequency: the top skills are its first rows
+    top_skills = df.head(30)[['frequency', 'skill']].itertuples(index=False, name=None)
+    for i, (frequency, skill) in enumerate(top_skills, 1):
+        print(f"   {i:2d}. [{frequency:4d}x] {skill}")
 
 
 if __name__ == "__main__":
@@ -3,38 +3,162 @@ Keyword Extraction Module
 Extracts important keywords from text using NLP techniques
 """
 
+import hashlib
+import os
 import re
-from typing import List, Set, Dict
-from collections import Counter
+import threading
+from typing import List, Set, Dict, Iterable, Optional, Sequence
+from collections import Counter, OrderedDict
+import numpy as np
 import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+# spaCy components the keyword extraction never uses. The dependency parser
+# is the most expensive one; "senter" ships disabled but is still loaded
+# unless excluded. NER, the lemmatizer and the attribute ruler (which maps
+# tags to token.pos_) are still needed by extract_keywords_spacy.
+DEFAULT_SPACY_EXCLUDE = ("parser", "senter")
+
+# Batch size / worker count used when several documents go through nlp.pipe
+SPACY_BATCH_SIZE = int(os.environ.get("ATS_SPACY_BATCH_SIZE", "16"))
+SPACY_N_PROCESS = int(os.environ.get("ATS_SPACY_N_PROCESS", "1"))
+
+# Number of extract_keywords results kept in memory (one JD is typically
+# scored against many resumes, and vice versa)
+KEYWORDS_CACHE_SIZE = int(os.environ.get("ATS_KEYWORDS_CACHE_SIZE", "128"))
+
+
+# Comprehensive technical skills and tools database
+TECHNICAL_SKILLS = frozenset({
+    # Programming languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c ', 'ruby', 'go', 'golang', 'rust',
+    'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'perl', 'bash', 'powershell',
+    'vba', 'sas', 'julia', 'dart', 'objective-c',
+    
+    # Web technologies
+    'html', 'html5', 'css', 'css3', 'react', 'reactjs', 'angular', 'angularjs', 'vue', 'vuejs',
+    'node.js', 'nodejs', 'django', 'flask', 'spring', 'spring boot', 'express', 'expressjs',
+    'fastapi', 'next.js', 'nextjs', 'gatsby', 'jquery', 'bootstrap', 'tailwind',
+    'asp.net', 'laravel', 'ruby on rails', 'svelte',
+    
+    # Databases & Data Storage
+    'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch', 'oracle',
+    'dynamodb', 'cassandra', 'neo4j', 'sqlite', 'mariadb', 'microsoft sql server',
+    'sql server', 'couchdb', 'firebase', 'snowflake', 'bigquery', 'redshift',
+    
+    # Cloud & DevOps
+    'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud',
+    'docker', 'kubernetes', 'k8s', 'jenkins', 'gitlab', 'github actions',
+    'terraform', 'ansible', 'ci/cd', 'circleci', 'travis ci', 'cloudformation',
+    'vagrant', 'puppet', 'chef', 'bamboo',
+    
+    # Data Science & ML & Analytics
+    'machine learning', 'deep learning', 'nlp', 'natural language processing',
+    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'sklearn', 'pandas', 'numpy',
+    'spark', 'apache spark', 'hadoop', 'pyspark', 'jupyter', 'tableau', 'power bi',
+    'looker', 'data analysis', 'data analytics', 'data visualization', 'data mining',
+    'statistical analysis', 'predictive modeling', 'forecasting', 'time series',
+    'regression', 'classification', 'clustering', 'neural networks', 'computer vision',
+    'image processing', 'opencv', 'data warehousing', 'etl', 'big data',
+    'business intelligence', 'analytics', 'quantitative analysis',
+    
+    # Operations & Business
+    'operations management', 'process optimization', 'supply chain', 'inventory management',
+    'logistics', 'lean', 'six sigma', 'kaizen', 'project management', 'agile', 'scrum',
+    'kanban', 'waterfall', 'business analysis', 'business process', 'kpi', 'metrics',
+    'performance management', 'quality assurance', 'quality control', 'continuous improvement',
+    
+    # Version Control & Collaboration
+    'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'version control',
+    
+    # Testing
+    'unit testing', 'integration testing', 'selenium', 'pytest', 'junit', 'jest',
+    'testing', 'test automation', 'qa', 'tdd', 'bdd',
+    
+    # Other technical tools
+    'linux', 'unix', 'windows server', 'jira', 'confluence', 'slack', 'teams',
+    'rest api', 'restful', 'graphql', 'soap', 'microservices', 'api',
+    'json', 'xml', 'yaml', 'grpc', 'websocket', 'oauth', 'jwt',
+    'excel', 'microsoft excel', 'google sheets', 'vba', 'macros',
+    'powerpoint', 'word', 'office 365', 'google workspace',
+    
+    # Soft Skills & Methods (important for operations/analytics roles)
+    'leadership', 'cross-functional', 'stakeholder management', 'communication',
+    'problem solving', 'critical thinking', 'decision making', 'strategic planning',
+    'change management', 'vendor management', 'budget management',
+    'root cause analysis', 'swot analysis', 'gap analysis',
+    
+    # Specific methodologies
+    'agile methodology', 'scrum methodology', 'devops', 'devsecops',
+    'continuous integration', 'continuous deployment', 'automation',
+})
+
+# Sorted skill table: extract_technical_skills builds a boolean mask over it,
+# so skill sets can be compared with numpy ops instead of string hashing
+SKILL_TABLE = np.array(sorted(TECHNICAL_SKILLS))
+SKILL_INDEX = {skill: i for i, skill in enumerate(SKILL_TABLE.tolist())}
+
+# Multi-word skills are matched as substrings, single-word skills on word
+# boundaries; the patterns are compiled once instead of on every call
+_MULTI_WORD_SKILLS = tuple(
+    (i, skill) for i, skill in enumerate(SKILL_TABLE.tolist()) if ' ' in skill
+)
+_SINGLE_WORD_SKILL_PATTERNS = tuple(
+    (i, re.compile(r'\b' + re.escape(skill) + r'\b'))
+    for i, skill in enumerate(SKILL_TABLE.tolist()) if ' ' not in skill
+)
 
 
 class KeywordExtractor:
     """Extract keywords from text using various NLP techniques"""
     
-    def __init__(self, use_spacy: bool = True):
+    def __init__(self, use_spacy: bool = True, 
+                 spacy_exclude: Optional[Sequence[str]] = DEFAULT_SPACY_EXCLUDE,
+                 lazy_load: bool = False):
         """
         Initialize the keyword extractor
         
         Args:
             use_spacy: Whether to use spaCy for advanced NLP processing
+            spacy_exclude: spaCy pipeline components to skip when loading the model
+            lazy_load: Load the spaCy model on first use instead of here
         """
         self.use_spacy = use_spacy
-        self.nlp = None
-        
-        if use_spacy:
+        self.spacy_exclude = list(spacy_exclude or [])
+        self._nlp = None
+        self._nlp_lock = threading.Lock()
+        self._keywords_cache = OrderedDict()
+        self._keywords_cache_lock = threading.Lock()
+        
+        if use_spacy and not lazy_load:
+            self._load_spacy()
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first access (None if spaCy is disabled or unavailable)"""
+        if self._nlp is None and self.use_spacy:
+            with self._nlp_lock:
+                if self._nlp is None and self.use_spacy:
+                    self._load_spacy()
+        return self._nlp
+    
+    @nlp.setter
+    def nlp(self, nlp):
+        self._nlp = nlp
+    
+    def _load_spacy(self):
+        """Load the spaCy model, disabling spaCy if no model is installed"""
+        try:
+            # Try to load the medium model first (better for entity recognition)
+            self._nlp = spacy.load("en_core_web_md", exclude=self.spacy_exclude)
+            print("✓ Loaded spaCy model: en_core_web_md")
+        except OSError:
             try:
-                # Try to load the medium model first (better for entity recognition)
-                self.nlp = spacy.load("en_core_web_md")
-                print("✓ Loaded spaCy model: en_core_web_md")
+                self._nlp = spacy.load("en_core_web_sm", exclude=self.spacy_exclude)
+                print("✓ Loaded spaCy model: en_core_web_sm")
             except OSError:
-                try:
-                    self.nlp = spacy.load("en_core_web_sm")
-                    print("✓ Loaded spaCy model: en_core_web_sm")
-                except OSError:
-                    print("⚠️ Warning: spaCy model not found. Install with: python -m spacy download en_core_web_md")
-                    self.use_spacy = False
+                print("⚠️ Warning: spaCy model not found. Install with: python -m spacy download en_core_web_md")
+                self.use_spacy = False
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -71,8 +195,10 @@ class KeywordExtractor:
         if not self.nlp:
             return []
         
-        doc = self.nlp(text)
-        
+        return self._keywords_from_doc(self.nlp(text), top_n)
+    
+    def _keywords_from_doc(self, doc, top_n: int = 20) -> List[str]:
+        """Collect the top entity/noun/adjective keywords of a processed spaCy Doc"""
         # Extract nouns, proper nouns, and important entities
         keywords = []
         
@@ -90,173 +216,88 @@ class KeywordExtractor:
         keyword_freq = Counter(keywords)
         return [kw for kw, _ in keyword_freq.most_common(top_n)]
     
-    def extract_keywords_tfidf(self, text: str, top_n: int = 20) -> List[str]:
+    def extract_technical_skills(self, text: str) -> Set[str]:
         """
-        Extract keywords using TF-IDF
+        Extract common technical skills and programming languages
         
         Args:
-            text: Text to extract keywords from
-            top_n: Number of top keywords to return
+            text: Text to extract skills from
             
         Returns:
-            List of extracted keywords
+            Set of detected skills
         """
-        # Preprocess
-        cleaned_text = self.preprocess_text(text)
-        
-        # Custom stop words - remove common but not meaningful words
-        custom_stop_words = [
-            'company', 'city', 'state', 'location', 'email', 'phone', 'address',
-            'january', 'february', 'march', 'april', 'may', 'june', 'july',
-            'august', 'september', 'october', 'november', 'december',
-            'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun',
-            '01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12'
-        ]
-        
-        # Use TF-IDF
-        vectorizer = TfidfVectorizer(
-            max_features=top_n * 2,  # Get more features to filter
-            stop_words='english',
-            ngram_range=(1, 3),  # Unigrams, bigrams, and trigrams
-            min_df=1,
-            max_df=0.95
-        )
-        
-        try:
-            tfidf_matrix = vectorizer.fit_transform([cleaned_text])
-            feature_names = vectorizer.get_feature_names_out()
-            
-            # Get TF-IDF scores
-            scores = tfidf_matrix.toarray()[0]
-            
-            # Sort by score
-            keyword_scores = list(zip(feature_names, scores))
-            keyword_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            # Filter out custom stop words and return top keywords
-            filtered_keywords = [
-                kw for kw, score in keyword_scores 
-                if kw not in custom_stop_words and len(kw) > 2
-            ]
-            
-            return filtered_keywords[:top_n]
-        except:
-            return []
+        skills_mask = self.technical_skills_mask(text)
+        return set(SKILL_TABLE[skills_mask].tolist())
     
-    def extract_technical_skills(self, text: str) -> Set[str]:
+    def technical_skills_mask(self, text: str) -> np.ndarray:
         """
-        Extract common technical skills and programming languages
+        Detect technical skills as a boolean mask over SKILL_TABLE
         
         Args:
             text: Text to extract skills from
             
         Returns:
-            Set of detected skills
+            Boolean array, True where SKILL_TABLE[i] occurs in the text
         """
         text_lower = text.lower()
-        
-        # Comprehensive technical skills and tools database
-        skills_database = {
-            # Programming languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c ', 'ruby', 'go', 'golang', 'rust',
-            'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'perl', 'bash', 'powershell',
-            'vba', 'sas', 'julia', 'dart', 'objective-c',
-            
-            # Web technologies
-            'html', 'html5', 'css', 'css3', 'react', 'reactjs', 'angular', 'angularjs', 'vue', 'vuejs',
-            'node.js', 'nodejs', 'django', 'flask', 'spring', 'spring boot', 'express', 'expressjs',
-            'fastapi', 'next.js', 'nextjs', 'gatsby', 'jquery', 'bootstrap', 'tailwind',
-            'asp.net', 'laravel', 'ruby on rails', 'svelte',
-            
-            # Databases & Data Storage
-            'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch', 'oracle',
-            'dynamodb', 'cassandra', 'neo4j', 'sqlite', 'mariadb', 'microsoft sql server',
-            'sql server', 'couchdb', 'firebase', 'snowflake', 'bigquery', 'redshift',
-            
-            # Cloud & DevOps
-            'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud',
-            'docker', 'kubernetes', 'k8s', 'jenkins', 'gitlab', 'github actions',
-            'terraform', 'ansible', 'ci/cd', 'circleci', 'travis ci', 'cloudformation',
-            'vagrant', 'puppet', 'chef', 'bamboo',
-            
-            # Data Science & ML & Analytics
-            'machine learning', 'deep learning', 'nlp', 'natural language processing',
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'sklearn', 'pandas', 'numpy',
-            'spark', 'apache spark', 'hadoop', 'pyspark', 'jupyter', 'tableau', 'power bi',
-            'looker', 'data analysis', 'data analytics', 'data visualization', 'data mining',
-            'statistical analysis', 'predictive modeling', 'forecasting', 'time series',
-            'regression', 'classification', 'clustering', 'neural networks', 'computer vision',
-            'image processing', 'opencv', 'data warehousing', 'etl', 'big data',
-            'business intelligence', 'analytics', 'quantitative analysis',
-            
-            # Operations & Business
-            'operations management', 'process optimization', 'supply chain', 'inventory management',
-            'logistics', 'lean', 'six sigma', 'kaizen', 'project management', 'agile', 'scrum',
-            'kanban', 'waterfall', 'business analysis', 'business process', 'kpi', 'metrics',
-            'performance management', 'quality assurance', 'quality control', 'continuous improvement',
-            
-            # Version Control & Collaboration
-            'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'version control',
-            
-            # Testing
-            'unit testing', 'integration testing', 'selenium', 'pytest', 'junit', 'jest',
-            'testing', 'test automation', 'qa', 'tdd', 'bdd',
-            
-            # Other technical tools
-            'linux', 'unix', 'windows server', 'jira', 'confluence', 'slack', 'teams',
-            'rest api', 'restful', 'graphql', 'soap', 'microservices', 'api',
-            'json', 'xml', 'yaml', 'grpc', 'websocket', 'oauth', 'jwt',
-            'excel', 'microsoft excel', 'google sheets', 'vba', 'macros',
-            'powerpoint', 'word', 'office 365', 'google workspace',
-            
-            # Soft Skills & Methods (important for operations/analytics roles)
-            'leadership', 'cross-functional', 'stakeholder management', 'communication',
-            'problem solving', 'critical thinking', 'decision making', 'strategic planning',
-            'change management', 'vendor management', 'budget management',
-            'root cause analysis', 'swot analysis', 'gap analysis',
-            
-            # Specific methodologies
-            'agile methodology', 'scrum methodology', 'devops', 'devsecops',
-            'continuous integration', 'continuous deployment', 'automation',
-        }
-        
-        detected_skills = set()
+        skills_mask = np.zeros(len(SKILL_TABLE), dtype=bool)
         
         # First pass: exact phrase matching (for multi-word skills)
-        for skill in skills_database:
-            if ' ' in skill:  # Multi-word skills
-                if skill in text_lower:
-                    detected_skills.add(skill)
+        for i, skill in _MULTI_WORD_SKILLS:
+            if skill in text_lower:
+                skills_mask[i] = True
         
         # Second pass: word boundary matching (for single-word skills)
-        import re
-        for skill in skills_database:
-            if ' ' not in skill:  # Single-word skills
-                # Use word boundaries to avoid partial matches
-                # But be flexible with common variations
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    detected_skills.add(skill)
-        
-        return detected_skills
+        for i, pattern in _SINGLE_WORD_SKILL_PATTERNS:
+            if pattern.search(text_lower):
+                skills_mask[i] = True
+        
+        return skills_mask
     
-    def extract_keywords(self, text: str, top_n: int = 30) -> Dict[str, List[str]]:
+    @staticmethod
+    def skills_mask(skills: Iterable[str]) -> np.ndarray:
+        """
+        Boolean mask over SKILL_TABLE for an already extracted skill list
+        
+        Args:
+            skills: Skills returned by extract_technical_skills
+            
+        Returns:
+            Boolean array, True where SKILL_TABLE[i] is in skills
+        """
+        skills_mask = np.zeros(len(SKILL_TABLE), dtype=bool)
+        ids = [SKILL_INDEX[skill] for skill in skills if skill in SKILL_INDEX]
+        skills_mask[ids] = True
+        return skills_mask
+    
+    def extract_keywords(self, text: str, top_n: int = 30, use_spacy: bool = True,
+                         spacy_min_skills: Optional[int] = None) -> Dict[str, List[str]]:
         """
         Extract keywords using multiple methods
         
         Args:
             text: Text to extract keywords from
             top_n: Number of top keywords to return per method
+            use_spacy: Whether to run spaCy on this text (if a model is loaded)
+            spacy_min_skills: If set, run spaCy only when the regex pass found
+                fewer than this many technical skills
             
         Returns:
             Dictionary with keywords from different methods
         """
+        key = self._keywords_cache_key(text, top_n, use_spacy, spacy_min_skills)
+        result = self._get_cached_keywords(key)
+        if result is not None:
+            return result
+        
         result = {
             'technical_skills': list(self.extract_technical_skills(text)),
-            'tfidf_keywords': self.extract_keywords_tfidf(text, top_n),
         }
         
-        if self.use_spacy and self.nlp:
+        if spacy_min_skills is not None and len(result['technical_skills']) >= spacy_min_skills:
+            use_spacy = False
+        
+        if use_spacy and self.use_spacy and self.nlp:
             result['spacy_keywords'] = self.extract_keywords_spacy(text, top_n)
         
         # Combine all keywords
@@ -266,6 +307,110 @@ class KeywordExtractor:
         
         result['all_keywords'] = list(all_keywords)
         
+        self._cache_keywords(key, result)
+        
+        return dict(result)
+    
+    @staticmethod
+    def _keywords_cache_key(text: str, *options) -> tuple:
+        """Cache key for extract_keywords: digest of the text plus the call options"""
+        return (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),) + options
+    
+    def _get_cached_keywords(self, key: tuple) -> Optional[Dict[str, List[str]]]:
+        """Return a copy of a cached extract_keywords result, or None"""
+        with self._keywords_cache_lock:
+            result = self._keywords_cache.get(key)
+            if result is None:
+                return None
+            self._keywords_cache.move_to_end(key)
+        # Callers add/replace keys on the result, so hand out a copy
+        return dict(result)
+    
+    def _cache_keywords(self, key: tuple, result: Dict[str, List[str]]):
+        """Store an extract_keywords result, evicting the least recently used one"""
+        if KEYWORDS_CACHE_SIZE <= 0:
+            return
+        with self._keywords_cache_lock:
+            self._keywords_cache[key] = result
+            self._keywords_cache.move_to_end(key)
+            if len(self._keywords_cache) > KEYWORDS_CACHE_SIZE:
+                self._keywords_cache.popitem(last=False)
+    
+    def extract_keywords_batch(self, texts: List[str], top_n: int = 30) -> List[Dict[str, List[str]]]:
+        """
+        Extract keywords from several documents, running spaCy over them in one nlp.pipe call
+        
+        Args:
+            texts: Texts to extract keywords from
+            top_n: Number of top keywords to return per method
+            
+        Returns:
+            List of keyword dictionaries (same format as extract_keywords), one per text
+        """
+        keys = [self._keywords_cache_key(text, top_n, True, None) for text in texts]
+        results = [self._get_cached_keywords(key) for key in keys]
+        
+        # Only documents that are not cached yet go through extraction
+        pending = [i for i, result in enumerate(results) if result is None]
+        for i in pending:
+            results[i] = self.extract_keywords(texts[i], top_n, use_spacy=False)
+        
+        if pending and self.use_spacy and self.nlp:
+            # Never start more worker processes than there are documents
+            docs = self.nlp.pipe((texts[i] for i in pending), batch_size=SPACY_BATCH_SIZE,
+                                 n_process=min(SPACY_N_PROCESS, len(pending)))
+            for i, doc in zip(pending, docs):
+                result = results[i]
+                result['spacy_keywords'] = self._keywords_from_doc(doc, top_n)
+                result['all_keywords'] = list(set(result['all_keywords']) | set(result['spacy_keywords']))
+        
+        for i in pending:
+            self._cache_keywords(keys[i], results[i])
+            results[i] = dict(results[i])
+        
+        return results
+    
+    def find_keywords_in_text(self, text: str, keywords: List[str]) -> List[str]:
+        """
+        Find which of the given keywords occur in text using word-boundary regex
+        
+        Args:
+            text: Text to search
+            keywords: Keywords to look for (e.g. spaCy keywords of another document)
+            
+        Returns:
+            List of keywords present in the text
+        """
+        text_lower = text.lower()
+        return [
+            kw for kw in keywords
+            if re.search(r'\b' + re.escape(kw) + r'\b', text_lower)
+        ]
+    
+    def extract_keywords_lazy(self, text: str, query_keywords: Dict[str, List[str]],
+                              top_n: int = 30) -> Dict[str, List[str]]:
+        """
+        Extract keywords from a long document without running spaCy over it
+        
+        The regex skill extractor runs as usual; the spaCy keywords are taken
+        from the (short) query document and looked up in the text with regex.
+        
+        Args:
+            text: Text to extract keywords from (e.g. the resume)
+            query_keywords: Result of extract_keywords() on the query (e.g. the job description)
+            top_n: Number of top keywords to return per method
+            
+        Returns:
+            Dictionary with keywords from different methods
+        """
+        result = self.extract_keywords(text, top_n, use_spacy=False)
+        
+        if 'spacy_keywords' in query_keywords:
+            result['spacy_keywords'] = self.find_keywords_in_text(
+                text, query_keywords['spacy_keywords']
+            )
+            result['all_keywords'] = list(set(result['all_keywords']) | set(result['spacy_keywords']))
+        
         return result
     
     def extract_cv_entities(self, text: str) -> Dict:
@@ -4,6 +4,7 @@ Extracts technical skills, soft skills, years of experience, and certifications
 """
 
 import json
+import sys
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -308,27 +309,33 @@ Be thorough and extract as much detail as possible. If information is not availa
     
     def print_summary(self, data: Dict[str, Any]):
         """Print a formatted summary of extracted information"""
-        print(f"\n{'='*80}")
-        print("EXTRACTION SUMMARY")
-        print(f"{'='*80}\n")
+        # Build the whole summary and write it to stdout in one call
+        lines = [
+            f"\n{'='*80}",
+            "EXTRACTION SUMMARY",
+            f"{'='*80}\n",
+        ]
         
         # Professional Summary
         if data.get('summary'):
-            print("📝 Professional Summary:")
-            print(f"   {data['summary']}\n")
+            lines.append("📝 Professional Summary:")
+            lines.append(f"   {data['summary']}\n")
         
         # Experience
         if data.get('total_experience_years'):
-            print(f"💼 Total Experience: {data['total_experience_years']} years\n")
+            lines.append(f"💼 Total Experience: {data['total_experience_years']} years\n")
         
         # Technical Skills
         tech_skills = data.get('technical_skills', [])
         if tech_skills:
-            print(f"💻 Technical Skills ({len(tech_skills)}):")
+            lines.append(f"💻 Technical Skills ({len(tech_skills)}):")
             for skill_obj in tech_skills[:20]:  # Show first 20
-                skill_name = skill_obj.get('skill', skill_obj) if isinstance(skill_obj, dict) else skill_obj
-                years = skill_obj.get('years_experience') if isinstance(skill_obj, dict) else None
-                proficiency = skill_obj.get('proficiency') if isinstance(skill_obj, dict) else None
+                if isinstance(skill_obj, dict):
+                    skill_name = skill_obj.get('skill', skill_obj)
+                    years = skill_obj.get('years_experience')
+                    proficiency = skill_obj.get('proficiency')
+                else:
+                    skill_name, years, proficiency = skill_obj, None, None
                 
                 details = []
                 if years:
@@ -337,28 +344,28 @@ Be thorough and extract as much detail as possible. If information is not availa
                     details.append(proficiency)
                 
                 detail_str = f" ({', '.join(details)})" if details else ""
-                print(f"   • {skill_name}{detail_str}")
+                lines.append(f"   • {skill_name}{detail_str}")
             
             if len(tech_skills) > 20:
-                print(f"   ... and {len(tech_skills) - 20} more")
-            print()
+                lines.append(f"   ... and {len(tech_skills) - 20} more")
+            lines.append("")
         
         # Soft Skills
         soft_skills = data.get('soft_skills', [])
         if soft_skills:
-            print(f"🤝 Soft Skills ({len(soft_skills)}):")
+            lines.append(f"🤝 Soft Skills ({len(soft_skills)}):")
             for skill_obj in soft_skills[:15]:  # Show first 15
                 skill_name = skill_obj.get('skill', skill_obj) if isinstance(skill_obj, dict) else skill_obj
-                print(f"   • {skill_name}")
+                lines.append(f"   • {skill_name}")
             
             if len(soft_skills) > 15:
-                print(f"   ... and {len(soft_skills) - 15} more")
-            print()
+                lines.append(f"   ... and {len(soft_skills) - 15} more")
+            lines.append("")
         
         # Certifications
         certifications = data.get('certifications', [])
         if certifications:
-            print(f"🏆 Certifications ({len(certifications)}):")
+            lines.append(f"🏆 Certifications ({len(certifications)}):")
             for cert in certifications:
                 if isinstance(cert, dict):
                     name = cert.get('name', '')
@@ -369,15 +376,15 @@ Be thorough and extract as much detail as possible. If information is not availa
                         cert_str += f" - {issuer}"
                     if year:
                         cert_str += f" ({year})"
-                    print(f"   • {cert_str}")
+                    lines.append(f"   • {cert_str}")
                 else:
-                    print(f"   • {cert}")
-            print()
+                    lines.append(f"   • {cert}")
+            lines.append("")
         
         # Education
         education = data.get('education', [])
         if education:
-            print(f"🎓 Education ({len(education)}):")
+            lines.append(f"🎓 Education ({len(education)}):")
             for edu in education:
                 if isinstance(edu, dict):
                     degree = edu.get('degree', '')
@@ -392,26 +399,29 @@ Be thorough and extract as much detail as possible. If information is not availa
                         edu_str += f" - {institution}"
                     if year:
                         edu_str += f" ({year})"
-                    print(f"   • {edu_str}")
+                    lines.append(f"   • {edu_str}")
                 else:
-                    print(f"   • {edu}")
-            print()
+                    lines.append(f"   • {edu}")
+            lines.append("")
         
         # Job Titles
         job_titles = data.get('job_titles', [])
         if job_titles:
-            print(f"👔 Job Titles ({len(job_titles)}):")
+            lines.append(f"👔 Job Titles ({len(job_titles)}):")
             for title in job_titles:
-                print(f"   • {title}")
-            print()
+                lines.append(f"   • {title}")
+            lines.append("")
         
         # Industries
         industries = data.get('industries', [])
         if industries:
-            print(f"🏭 Industries:")
+            lines.append(f"🏭 Industries:")
             for industry in industries:
-                print(f"   • {industry}")
-            print()
+                lines.append(f"   • {industry}")
+            lines.append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def save_results(self, data: Dict[str, Any], output_path: str = "llm_extraction_results.json"):
         """Save extraction results to JSON file"""
@@ -3,16 +3,89 @@ PDF Text Extraction Module
 Extracts text content from PDF files (resumes)
 """
 
+import io
+import os
 import PyPDF2
 import re
-from typing import Optional, Dict, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Dict, Iterable, List
 from pathlib import Path
 
+try:
+    # PyMuPDF is much faster than PyPDF2 at text extraction (optional)
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24.3
+    except ImportError:
+        pymupdf = None
+
+# Number of extracted PDF texts kept in memory, keyed by (path, mtime, size)
+TEXT_CACHE_SIZE = int(os.environ.get("ATS_PDF_TEXT_CACHE_SIZE", "64"))
+
+# Minimum page count for which extract_text_parallel uses a process pool
+PARALLEL_MIN_PAGES = int(os.environ.get("ATS_PDF_PARALLEL_MIN_PAGES", "16"))
+
+# Bullet point characters, found with a single character-class scan of the text
+BULLET_CHARS = ('•', '●', '◦', '▪', '▫', '■', '□', '-', '*', '→')
+_BULLET_RE = re.compile('[' + ''.join(re.escape(bullet) for bullet in BULLET_CHARS) + ']')
+
+# A CV section header may end with one of these; short lines containing one of
+# these words are not headers
+_HEADER_SUFFIXES = (':', '|', '-', '–')
+_NON_HEADER_WORDS = ('at', 'in', 'for', 'with', 'as')
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> str:
+    """Extract the text of pages [start, end) of a PDF (process pool worker)"""
+    if pymupdf is not None:
+        try:
+            with pymupdf.open(pdf_path) as doc:
+                return "".join(doc[i].get_text("text") for i in range(start, end))
+        except Exception:
+            # Fall back to PyPDF2 for files PyMuPDF cannot handle
+            pass
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return "".join(pdf_reader.pages[i].extract_text() for i in range(start, end))
+
+
+def _join_stripped(page_texts: Iterable[str]) -> str:
+    """
+    "".join(page_texts).strip() without building the unstripped copy first
+    
+    Only the outer pages are stripped (whitespace-only pages at either end are
+    dropped), so the document text is materialized once instead of twice.
+    """
+    pages = list(page_texts)
+    start, end = 0, len(pages)
+    while start < end and (not pages[start] or pages[start].isspace()):
+        start += 1
+    while end > start and (not pages[end - 1] or pages[end - 1].isspace()):
+        end -= 1
+    if start == end:
+        return ""
+    
+    pages[start] = pages[start].lstrip()
+    pages[end - 1] = pages[end - 1].rstrip()
+    return "".join(pages[start:end])
+
 
 class PDFExtractor:
     """Extract text from PDF files with format detection"""
     
     def __init__(self):
+        self._text_cache = OrderedDict()
+        self._text_cache_lock = threading.Lock()
+        self._text_pending = {}  # cache key -> Future of an extraction in progress
+        self._page_counts = OrderedDict()  # cache key -> page count (seen by quick_probe)
+        self._page_pool = None  # page-range process pool, reused across documents
+        self._page_pool_workers = 0
+        self._page_pool_lock = threading.Lock()
+        
         # Common CV section headers
         self.cv_sections = [
             'experience', 'work experience', 'professional experience', 'employment',
@@ -55,27 +128,283 @@ class PDFExtractor:
         Returns:
             Extracted text as a string
             
+        Raises:
+            FileNotFoundError: If the PDF file doesn't exist
+            Exception: If there's an error reading the PDF
+        """
+        return self._extract_text_cached(pdf_path, workers=1)
+    
+    def extract_text_parallel(self, pdf_path: str, workers: Optional[int] = None) -> str:
+        """
+        Extract text from a PDF file, splitting long documents into page ranges
+        extracted by a process pool
+        
+        Documents with at most PARALLEL_MIN_PAGES pages are extracted in-process
+        like extract_text.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            workers: Number of worker processes (default: os.cpu_count())
+            
+        Returns:
+            Extracted text as a string
+            
+        Raises:
+            FileNotFoundError: If the PDF file doesn't exist
+            Exception: If there's an error reading the PDF
+        """
+        return self._extract_text_cached(pdf_path, workers or os.cpu_count() or 1)
+    
+    def _extract_text_cached(self, pdf_path: str, workers: int) -> str:
+        """Extract text (in parallel when workers > 1), reusing the text of unchanged files"""
+        try:
+            # A file that has not changed since the last call is not re-parsed, and
+            # concurrent calls for the same file (e.g. analyze's format analysis
+            # thread and its text extraction) share a single extraction
+            key = self._file_key(pdf_path)
+            with self._text_cache_lock:
+                if key in self._text_cache:
+                    self._text_cache.move_to_end(key)
+                    return self._text_cache[key]
+                pending = self._text_pending.get(key)
+                is_owner = pending is None
+                if is_owner:
+                    pending = self._text_pending[key] = Future()
+            
+            if not is_owner:
+                return pending.result()
+            
+            try:
+                text = self._extract_text_uncached(pdf_path, workers)
+            except BaseException as e:
+                with self._text_cache_lock:
+                    del self._text_pending[key]
+                pending.set_exception(e)
+                raise
+            
+            with self._text_cache_lock:
+                del self._text_pending[key]
+                if TEXT_CACHE_SIZE > 0:
+                    self._text_cache[key] = text
+                    if len(self._text_cache) > TEXT_CACHE_SIZE:
+                        self._text_cache.popitem(last=False)
+            pending.set_result(text)
+            
+            return text
+                
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        except Exception as e:
+            raise Exception(f"Error extracting text from PDF: {str(e)}")
+    
+    def _extract_text_uncached(self, pdf_path: str, workers: int) -> str:
+        """Extract text with the fastest available backend"""
+        text = None
+        if workers > 1:
+            text = self._extract_text_page_ranges(pdf_path, workers)
+        
+        if text is None and pymupdf is not None:
+            try:
+                text = self._extract_text_pymupdf(pdf_path)
+            except Exception:
+                # Fall back to PyPDF2 for files PyMuPDF cannot handle
+                pass
+        
+        if text is None:
+            text = self._extract_text_pypdf2(pdf_path)
+        
+        return text
+    
+    def _extract_text_page_ranges(self, pdf_path: str, workers: int) -> Optional[str]:
+        """Extract page ranges in a process pool; None if the document is too short to be worth it"""
+        page_count = self._get_page_count(pdf_path)
+        if page_count <= PARALLEL_MIN_PAGES:
+            return None
+        
+        executor = self._get_page_pool(workers)
+        workers = min(workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        try:
+            page_texts = executor.map(_extract_page_range, [pdf_path] * workers, bounds[:-1], bounds[1:])
+            return _join_stripped(page_texts)
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool on the next call
+            with self._page_pool_lock:
+                if self._page_pool is executor:
+                    self._page_pool = None
+            raise
+    
+    def _get_page_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Process pool with at least `workers` processes, started once and reused"""
+        with self._page_pool_lock:
+            if self._page_pool is None or self._page_pool_workers < workers:
+                if self._page_pool is not None:
+                    self._page_pool.shutdown(wait=False)
+                self._page_pool = ProcessPoolExecutor(max_workers=workers)
+                self._page_pool_workers = workers
+            return self._page_pool
+    
+    def close(self):
+        """Shut down the page-range process pool, if one was started"""
+        with self._page_pool_lock:
+            if self._page_pool is not None:
+                self._page_pool.shutdown()
+                self._page_pool = None
+    
+    @staticmethod
+    def _file_key(pdf_path: str) -> tuple:
+        """Cache key of a PDF file: (absolute path, mtime, size)"""
+        stat = os.stat(pdf_path)
+        return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+    
+    def _remember_page_count(self, pdf_path: str, page_count: int):
+        """Keep the page count of an opened PDF so extraction need not reopen it to count pages"""
+        if TEXT_CACHE_SIZE <= 0:
+            return
+        key = self._file_key(pdf_path)
+        with self._text_cache_lock:
+            self._page_counts[key] = page_count
+            if len(self._page_counts) > TEXT_CACHE_SIZE:
+                self._page_counts.popitem(last=False)
+    
+    def _get_page_count(self, pdf_path: str) -> int:
+        """Number of pages of a PDF file (from quick_probe when it already opened it)"""
+        with self._text_cache_lock:
+            page_count = self._page_counts.get(self._file_key(pdf_path))
+        if page_count is not None:
+            return page_count
+        
+        page_count = None
+        if pymupdf is not None:
+            try:
+                with pymupdf.open(pdf_path) as doc:
+                    page_count = len(doc)
+            except Exception:
+                pass
+        if page_count is None:
+            with open(pdf_path, 'rb') as file:
+                page_count = len(PyPDF2.PdfReader(file).pages)
+        self._remember_page_count(pdf_path, page_count)
+        return page_count
+    
+    def quick_probe(self, pdf_path: str) -> int:
+        """
+        Count the text characters on the first page of a PDF, without parsing
+        the rest of the document
+        
+        A scanned (image-only) resume has next to no text on its first page,
+        so this is a cheap way to reject it before a full extraction.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Length of the stripped first-page text (0 if the PDF has no pages)
+            
         Raises:
             FileNotFoundError: If the PDF file doesn't exist
             Exception: If there's an error reading the PDF
         """
         try:
+            if pymupdf is not None:
+                try:
+                    with pymupdf.open(pdf_path) as doc:
+                        self._remember_page_count(pdf_path, len(doc))
+                        return len(doc[0].get_text("text").strip()) if len(doc) else 0
+                except Exception:
+                    # Fall back to PyPDF2 for files PyMuPDF cannot handle
+                    pass
+            
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                
-                # Extract text from all pages
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text()
-                
-                return text.strip()
+                self._remember_page_count(pdf_path, len(pdf_reader.pages))
+                if not pdf_reader.pages:
+                    return 0
+                return len(pdf_reader.pages[0].extract_text().strip())
                 
         except FileNotFoundError:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        except Exception as e:
+            raise Exception(f"Error probing PDF: {str(e)}")
+    
+    def extract_text_from_bytes(self, pdf_bytes: bytes,
+                                progress_callback: Optional[Callable[[float, str], None]] = None) -> str:
+        """
+        Extract text from an in-memory PDF (e.g. an uploaded file)
+        
+        Args:
+            pdf_bytes: PDF file content (bytes or memoryview)
+            progress_callback: Optional callable(fraction, message) called after each page
+            
+        Returns:
+            Extracted text as a string
+            
+        Raises:
+            Exception: If there's an error reading the PDF
+        """
+        try:
+            if pymupdf is not None:
+                try:
+                    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+                        return self._join_pages(
+                            (page.get_text("text") for page in doc), len(doc), progress_callback
+                        )
+                except Exception:
+                    # Fall back to PyPDF2 for files PyMuPDF cannot handle
+                    pass
+            
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+            return self._join_pages(
+                (page.extract_text() for page in pdf_reader.pages), len(pdf_reader.pages), progress_callback
+            )
+            
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
     
+    def extract_text_from_bytes_safe(self, pdf_bytes: bytes,
+                                     progress_callback: Optional[Callable[[float, str], None]] = None) -> Optional[str]:
+        """
+        Safely extract text from an in-memory PDF, returning None on error
+        
+        Args:
+            pdf_bytes: PDF file content (bytes or memoryview)
+            progress_callback: Optional callable(fraction, message) called after each page
+            
+        Returns:
+            Extracted text as a string or None if extraction fails
+        """
+        try:
+            return self.extract_text_from_bytes(pdf_bytes, progress_callback)
+        except Exception as e:
+            print(f"Warning: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _join_pages(page_texts, page_count: int,
+                    progress_callback: Optional[Callable[[float, str], None]] = None) -> str:
+        """Join page texts, reporting progress after each page when a callback is given"""
+        if progress_callback is None:
+            return _join_stripped(page_texts)
+        
+        texts = []
+        for page_num, page_text in enumerate(page_texts, 1):
+            texts.append(page_text)
+            progress_callback(page_num / page_count, f"Extracted page {page_num}/{page_count}")
+        return _join_stripped(texts)
+    
+    def _extract_text_pymupdf(self, pdf_path: str) -> str:
+        """Extract text from all pages with PyMuPDF"""
+        with pymupdf.open(pdf_path) as doc:
+            return _join_stripped(page.get_text("text") for page in doc)
+    
+    def _extract_text_pypdf2(self, pdf_path: str) -> str:
+        """Extract text from all pages with PyPDF2"""
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            
+            # Extract text from all pages (joined once rather than grown page by page)
+            return _join_stripped(page.extract_text() for page in pdf_reader.pages)
+    
     def extract_text_safe(self, pdf_path: str) -> Optional[str]:
         """
         Safely extract text from a PDF file, returning None on error
@@ -132,11 +461,16 @@ class PDFExtractor:
         section_positions = []
         for i, line in enumerate(lines):
             line_lower = line.lower().strip()
+            
+            # Per-line parts of the header test, computed once instead of per section:
+            # the line without its trailing ':', '|', '-' or '–' (an exact header)...
+            header = line_lower[:-1].rstrip() if line_lower.endswith(_HEADER_SUFFIXES) else line_lower
+            # ...and whether a short line may contain a section name
+            is_short_plain = len(line_lower) < 50 and not any(word in line_lower for word in _NON_HEADER_WORDS)
+            
             for section in self.cv_sections:
                 # Check if line is a section header
-                if re.match(r'^' + re.escape(section) + r'\s*[:|\-|–]?\s*$', line_lower) or \
-                   (section in line_lower and len(line_lower) < 50 and 
-                    not any(word in line_lower for word in ['at', 'in', 'for', 'with', 'as'])):
+                if header == section or (is_short_plain and section in line_lower):
                     section_positions.append({
                         'name': section,
                         'line': i,
@@ -167,12 +501,13 @@ class PDFExtractor:
         
         return extracted_sections
     
-    def extract_languages(self, text: str) -> Dict[str, any]:
+    def extract_languages(self, text: str, sections: Optional[Dict[str, str]] = None) -> Dict[str, any]:
         """
         Extract language information from CV text
         
         Args:
             text: Extracted text from CV
+            sections: extract_sections(text), if the caller already has it
             
         Returns:
             Dictionary with language information
@@ -180,7 +515,8 @@ class PDFExtractor:
         text_lower = text.lower()
         
         # First, try to get from dedicated Languages section
-        sections = self.extract_sections(text)
+        if sections is None:
+            sections = self.extract_sections(text)
         languages_section = None
         
         for section_name, content in sections.items():
@@ -253,7 +589,7 @@ class PDFExtractor:
         extracted_content = self.extract_sections(text)
         
         # Extract languages
-        language_info = self.extract_languages(text)
+        language_info = self.extract_languages(text, extracted_content)
         
         # Detect contact information
         has_email = bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text))
@@ -261,13 +597,13 @@ class PDFExtractor:
         has_linkedin = 'linkedin' in text_lower
         has_github = 'github' in text_lower
         
-        # Detect formatting quality
-        non_empty_lines = [line for line in lines if line.strip()]
-        avg_line_length = sum(len(line) for line in non_empty_lines) / len(non_empty_lines) if non_empty_lines else 0
+        # Detect formatting quality (only the lengths of non-empty lines are needed,
+        # summed in C instead of through a generator)
+        non_empty_lengths = [len(line) for line in lines if line.strip()]
+        avg_line_length = sum(non_empty_lengths) / len(non_empty_lengths) if non_empty_lengths else 0
         
         # Detect bullet points
-        bullet_patterns = ['•', '●', '◦', '▪', '▫', '■', '□', '-', '*', '→']
-        has_bullets = any(bullet in text for bullet in bullet_patterns)
+        has_bullets = _BULLET_RE.search(text) is not None
         
         # Count dates (years in format YYYY or MM/YYYY)
         date_pattern = r'\b(19|20)\d{2}\b'
@@ -324,7 +660,7 @@ class PDFExtractor:
                 'dates_found': dates_found,
                 'avg_line_length': round(avg_line_length, 2),
                 'total_lines': len(lines),
-                'non_empty_lines': len(non_empty_lines)
+                'non_empty_lines': len(non_empty_lengths)
             },
             'quality_issues': readability_issues,
             'ats_friendly_score': ats_score,
@@ -5,18 +5,30 @@ Loads skills from the provided CSV dataset
 """
 
 import json
-import pickle
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Set, Tuple
+from typing import Callable, List, Dict, Optional, Set, Tuple
 from pathlib import Path
 import re
+from functools import lru_cache
 from tqdm import tqdm
 
+try:
+    # FAISS inner-product index for the skill lookup (optional)
+    import faiss
+except ImportError:
+    faiss = None
+
 
 class RAGSkillsExtractor:
     """Extract skills using RAG (Retrieval-Augmented Generation) with CSV dataset"""
     
+    # N-grams encoded per model.encode call when reporting progress
+    ENCODE_CHUNK_SIZE = 1024
+    
+    # Target role / job description embeddings kept by get_skill_recommendations
+    ROLE_EMBEDDING_CACHE_SIZE = 128
+    
     def __init__(
         self, 
         skills_csv_path: str = r'C:\Users\Admin\Documents\ATS-agent\data\skills_exploded (2).csv',
@@ -37,10 +49,14 @@ class RAGSkillsExtractor:
         self.model = None
         self.skills_list = None
         self.skill_embeddings = None
+        self.index = None
+        self._encode_role = lru_cache(maxsize=self.ROLE_EMBEDDING_CACHE_SIZE)(self._encode_role)
         
-        # Cache file based on max_skills setting
+        # Cache files based on max_skills setting: L2-normalized FP16 embeddings as
+        # .npy (memory-mapped on load) and the matching skills list as .json
         cache_suffix = f'_{max_skills}' if max_skills else '_full'
-        self.embeddings_cache_path = Path(f'skills_embeddings_csv{cache_suffix}.pkl')
+        self.embeddings_cache_path = Path(f'skills_embeddings_csv{cache_suffix}_fp16.npy')
+        self.skills_cache_path = Path(f'skills_embeddings_csv{cache_suffix}.json')
         
         self._initialize_model()
         self._load_skills_from_csv()
@@ -66,12 +82,19 @@ class RAGSkillsExtractor:
         print(f"Loading skills from CSV: {self.skills_csv_path}")
         
         try:
-            # Read CSV file
+            # Read CSV file (only the first, skills column is used)
             if self.max_skills:
-                df = pd.read_csv(self.skills_csv_path, nrows=self.max_skills)
+                # nrows already bounds the parse; the pyarrow engine doesn't support it
+                df = pd.read_csv(self.skills_csv_path, usecols=[0], nrows=self.max_skills)
                 print(f"✓ Loaded {len(df)} skills (limited to {self.max_skills})")
             else:
-                df = pd.read_csv(self.skills_csv_path)
+                try:
+                    # Multithreaded Arrow parser for the full file. It only takes
+                    # usecols by name, so the header is read first.
+                    skills_column = pd.read_csv(self.skills_csv_path, nrows=0).columns[0]
+                    df = pd.read_csv(self.skills_csv_path, engine='pyarrow', usecols=[skills_column])
+                except ImportError:
+                    df = pd.read_csv(self.skills_csv_path, usecols=[0])
                 print(f"✓ Loaded {len(df)} skills from CSV")
             
             # Get unique skills and clean them
@@ -94,20 +117,19 @@ class RAGSkillsExtractor:
     
     def _load_or_create_embeddings(self):
         """Load existing embeddings or create new ones"""
-        if self.embeddings_cache_path.exists():
+        if self.embeddings_cache_path.exists() and self.skills_cache_path.exists():
             print(f"Loading cached skill embeddings from {self.embeddings_cache_path}...")
             try:
-                with open(self.embeddings_cache_path, 'rb') as f:
-                    cache_data = pickle.load(f)
-                    self.skill_embeddings = cache_data['embeddings']
-                    cached_skills = cache_data['skills']
-                    
-                    # Verify cache matches current skills
-                    if cached_skills == self.skills_list:
-                        print(f"✓ Loaded embeddings for {len(self.skills_list)} skills from cache")
-                        return
-                    else:
-                        print("⚠ Cache doesn't match current skills, regenerating...")
+                with open(self.skills_cache_path, 'r', encoding='utf-8') as f:
+                    cached_skills = json.load(f)
+                
+                # Verify cache matches current skills
+                if cached_skills == self.skills_list:
+                    self.skill_embeddings = np.load(self.embeddings_cache_path, mmap_mode='r')
+                    print(f"✓ Loaded embeddings for {len(self.skills_list)} skills from cache")
+                    return
+                else:
+                    print("⚠ Cache doesn't match current skills, regenerating...")
             except Exception as e:
                 print(f"Warning: Could not load cache: {e}")
         
@@ -125,25 +147,49 @@ class RAGSkillsExtractor:
         
         for i in tqdm(range(0, len(self.skills_list), batch_size), desc="Encoding skills"):
             batch = self.skills_list[i:i+batch_size]
-            batch_embeddings = self.model.encode(batch, show_progress_bar=False)
+            batch_embeddings = self.model.encode(
+                batch, show_progress_bar=False, normalize_embeddings=True
+            )
             embeddings_list.append(batch_embeddings)
         
-        self.skill_embeddings = np.vstack(embeddings_list)
+        # Unit-length rows (cosine similarity becomes a plain dot product),
+        # stored as FP16 to halve memory and cache size
+        self.skill_embeddings = np.vstack(embeddings_list).astype(np.float16)
         print(f"✓ Created embeddings with shape: {self.skill_embeddings.shape}")
     
     def _save_embeddings(self):
         """Save embeddings to cache file"""
         try:
-            cache_data = {
-                'skills': self.skills_list,
-                'embeddings': self.skill_embeddings
-            }
-            with open(self.embeddings_cache_path, 'wb') as f:
-                pickle.dump(cache_data, f)
+            np.save(self.embeddings_cache_path, self.skill_embeddings)
+            with open(self.skills_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.skills_list, f, ensure_ascii=False)
             print(f"✓ Saved embeddings to {self.embeddings_cache_path}")
         except Exception as e:
             print(f"Warning: Could not save embeddings cache: {e}")
     
+    def warmup(self):
+        """
+        Load the memory-mapped FP16 skill embeddings into RAM as FP32 and warm up the model
+        
+        Call once at startup so the first extraction doesn't pay for
+        reading the embeddings from disk. FP32 keeps the similarity matmul
+        on the BLAS path (numpy has no fast FP16 matmul on CPU). Also runs
+        one throwaway encode so the model's first-inference setup cost is
+        paid here instead of on the first real request.
+        """
+        self.skill_embeddings = np.array(self.skill_embeddings, dtype=np.float32)
+        self._get_index()
+        self.model.encode(["warmup"], show_progress_bar=False, convert_to_numpy=True)
+    
+    def _get_index(self):
+        """Build (once) a FAISS inner-product index over the skill embeddings, if FAISS is installed"""
+        if self.index is None and faiss is not None:
+            embeddings = np.ascontiguousarray(self.skill_embeddings, dtype=np.float32)
+            self.index = faiss.IndexFlatIP(embeddings.shape[1])
+            self.index.add(embeddings)
+            print(f"✓ Built FAISS index with {self.index.ntotal} skills")
+        return self.index
+    
     def _extract_ngrams(self, text: str, n_range: Tuple[int, int] = (1, 5)) -> List[str]:
         """
         Extract n-grams from text
@@ -173,7 +219,8 @@ class RAGSkillsExtractor:
         text: str, 
         threshold: float = 0.6,
         top_k: int = None,
-        return_scores: bool = False
+        return_scores: bool = False,
+        progress_callback: Optional[Callable[[float, str], None]] = None
     ) -> List[str] | List[Tuple[str, float]]:
         """
         Extract skills using RAG approach with semantic similarity
@@ -183,36 +230,106 @@ class RAGSkillsExtractor:
             threshold: Minimum similarity threshold (0-1). Higher = stricter matching
             top_k: If set, return only top k matches regardless of threshold
             return_scores: If True, return (skill, score) tuples
+            progress_callback: Optional callable(fraction, message) called after each encoded chunk
             
         Returns:
             List of detected skills or list of (skill, score) tuples
         """
-        # Extract n-grams from text
-        ngrams = self._extract_ngrams(text)
-        
-        if not ngrams:
-            return [] if not return_scores else []
-        
-        # Encode all n-grams
-        print(f"Encoding {len(ngrams)} text segments...")
-        ngram_embeddings = self.model.encode(ngrams, show_progress_bar=False)
+        return self.extract_skills_rag_batch(
+            [text], threshold, top_k, return_scores, progress_callback
+        )[0]
+    
+    def extract_skills_rag_batch(
+        self,
+        texts: List[str],
+        threshold: float = 0.6,
+        top_k: int = None,
+        return_scores: bool = False,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> List[List[str] | List[Tuple[str, float]]]:
+        """
+        Extract skills from several texts, encoding all their n-grams in one batch
         
-        # Calculate similarity between each n-gram and all skills
-        from sklearn.metrics.pairwise import cosine_similarity
+        Args:
+            texts: Input texts (e.g. resume and job description)
+            threshold: Minimum similarity threshold (0-1). Higher = stricter matching
+            top_k: If set, return only top k matches regardless of threshold
+            return_scores: If True, return (skill, score) tuples
+            progress_callback: Optional callable(fraction, message) called after each encoded chunk
+            
+        Returns:
+            One result per text, each as returned by extract_skills_rag
+        """
+        # Extract n-grams from every text
+        ngrams_per_text = [self._extract_ngrams(text) for text in texts]
+        all_ngrams = [ngram for ngrams in ngrams_per_text for ngram in ngrams]
+        
+        if not all_ngrams:
+            return [[] for _ in texts]
+        
+        # Encode all n-grams together; with a progress callback, in chunks
+        # so progress can be reported between them
+        print(f"Encoding {len(all_ngrams)} text segments...")
+        chunk_size = self.ENCODE_CHUNK_SIZE if progress_callback else len(all_ngrams)
+        embedding_chunks = []
+        for start in range(0, len(all_ngrams), chunk_size):
+            embedding_chunks.append(self.model.encode(
+                all_ngrams[start:start + chunk_size],
+                batch_size=64,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ))
+            if progress_callback:
+                encoded = min(start + chunk_size, len(all_ngrams))
+                progress_callback(encoded / len(all_ngrams),
+                                  f"Encoded {encoded}/{len(all_ngrams)} text segments")
+        all_embeddings = np.concatenate(embedding_chunks)
+        
+        results = []
+        start = 0
+        for ngrams in ngrams_per_text:
+            end = start + len(ngrams)
+            results.append(
+                self._match_skills(all_embeddings[start:end], threshold, top_k, return_scores)
+            )
+            start = end
+        
+        return results
+    
+    def _match_skills(
+        self,
+        ngram_embeddings: np.ndarray,
+        threshold: float,
+        top_k: int = None,
+        return_scores: bool = False
+    ) -> List[str] | List[Tuple[str, float]]:
+        """Find the skills whose embedding is within threshold of any n-gram embedding"""
+        if len(ngram_embeddings) == 0:
+            return []
         
         print("Computing similarity scores...")
-        # Compute similarity matrix (ngrams x skills)
-        similarities = cosine_similarity(ngram_embeddings, self.skill_embeddings)
-        
-        # For each skill, get the maximum similarity with any n-gram
-        max_similarities = np.max(similarities, axis=0)
+        # Both sides are L2-normalized so the inner product is the cosine similarity
+        index = self._get_index()
+        if index is not None:
+            # Only (n-gram, skill) pairs above the threshold come back
+            _, scores, skill_ids = index.range_search(
+                np.ascontiguousarray(ngram_embeddings, dtype=np.float32), threshold
+            )
+            max_similarities = np.full(len(self.skills_list), -1.0, dtype=np.float32)
+            np.maximum.at(max_similarities, skill_ids, scores)
+        else:
+            # Compute similarity matrix (ngrams x skills)
+            similarities = ngram_embeddings @ self.skill_embeddings.T
+            
+            # For each skill, get the maximum similarity with any n-gram
+            max_similarities = np.max(similarities, axis=0)
         
         # Get skills above threshold
-        detected_skills = []
-        for idx, score in enumerate(max_similarities):
-            if score >= threshold:
-                skill = self.skills_list[idx]
-                detected_skills.append((skill, float(score)))
+        detected_skills = [
+            (self.skills_list[idx], float(max_similarities[idx]))
+            for idx in np.flatnonzero(max_similarities >= threshold)
+        ]
         
         # Sort by score
         detected_skills.sort(key=lambda x: x[1], reverse=True)
@@ -246,14 +363,13 @@ class RAGSkillsExtractor:
             Dictionary with matched, missing, and additional skills
         """
         print("\n" + "="*80)
-        print("EXTRACTING SKILLS FROM RESUME")
+        print("EXTRACTING SKILLS FROM RESUME AND JOB DESCRIPTION")
         print("="*80)
-        resume_skills = set(self.extract_skills_rag(resume_text, threshold=threshold))
-        
-        print("\n" + "="*80)
-        print("EXTRACTING SKILLS FROM JOB DESCRIPTION")
-        print("="*80)
-        job_skills = set(self.extract_skills_rag(job_desc_text, threshold=threshold))
+        resume_result, job_result = self.extract_skills_rag_batch(
+            [resume_text, job_desc_text], threshold=threshold
+        )
+        resume_skills = set(resume_result)
+        job_skills = set(job_result)
         
         matched = resume_skills & job_skills
         missing = job_skills - resume_skills
@@ -268,6 +384,15 @@ class RAGSkillsExtractor:
             'job_skill_count': len(job_skills)
         }
     
+    def _encode_role(self, text: str) -> np.ndarray:
+        """Embedding of a target role / job description (memoized per instance, read-only)"""
+        embedding = np.asarray(
+            self.model.encode([text], show_progress_bar=False, convert_to_numpy=True)[0],
+            dtype=np.float32
+        )
+        embedding.flags.writeable = False
+        return embedding
+    
     def get_skill_recommendations(
         self, 
         current_skills: List[str], 
@@ -293,19 +418,21 @@ class RAGSkillsExtractor:
         # Skills that are in target but not in current
         recommended = target_skills - set(current_skills)
         
-        # Encode target role
-        role_embedding = self.model.encode([target_role])[0]
+        # Cosine similarity between the role and all recommended skills in one matrix-vector product
+        skill_ids = {skill: idx for idx, skill in enumerate(self.skills_list)}
+        recommended = [skill for skill in recommended if skill in skill_ids]
+        if not recommended:
+            return []
         
-        # Calculate similarity between role and recommended skills
-        from sklearn.metrics.pairwise import cosine_similarity
+        skill_embeddings = np.asarray(
+            self.skill_embeddings[[skill_ids[skill] for skill in recommended]], dtype=np.float32
+        )
+        role_embedding = self._encode_role(target_role)
+        relevance = (skill_embeddings @ role_embedding) / (
+            np.linalg.norm(skill_embeddings, axis=1) * np.linalg.norm(role_embedding)
+        )
         
-        recommendations = []
-        for skill in recommended:
-            skill_idx = self.skills_list.index(skill) if skill in self.skills_list else None
-            if skill_idx is not None:
-                skill_embedding = self.skill_embeddings[skill_idx]
-                relevance = cosine_similarity([role_embedding], [skill_embedding])[0][0]
-                recommendations.append((skill, float(relevance)))
+        recommendations = [(skill, float(score)) for skill, score in zip(recommended, relevance)]
         
         # Sort by relevance and return top N
         recommendations.sort(key=lambda x: x[1], reverse=True)
@@ -3,18 +3,19 @@ Similarity Calculation Module
 Calculates similarity scores between resume and job description
 """
 
-from typing import List, Dict, Tuple
+import math
+from typing import List, Dict, Iterable, Optional, Tuple
 from collections import Counter
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 
 class SimilarityCalculator:
     """Calculate similarity between resume and job description"""
     
     def __init__(self):
-        pass
+        # Tokenizer of the TF-IDF text similarity (stop words removed, 1-2 grams)
+        self._tfidf_analyzer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2)).build_analyzer()
     
     def jaccard_similarity(self, set1: set, set2: set) -> float:
         """
@@ -35,20 +36,20 @@ class SimilarityCalculator:
         
         return intersection / union if union > 0 else 0.0
     
-    def keyword_overlap_score(self, resume_keywords: List[str], 
-                             job_keywords: List[str]) -> Dict[str, float]:
+    def keyword_overlap_score(self, resume_keywords: Iterable[str], 
+                             job_keywords: Iterable[str]) -> Dict[str, float]:
         """
         Calculate keyword overlap metrics
         
         Args:
-            resume_keywords: Keywords from resume
-            job_keywords: Keywords from job description
+            resume_keywords: Keywords from resume (a list, or a set/frozenset used as is)
+            job_keywords: Keywords from job description (a list, or a set/frozenset used as is)
             
         Returns:
             Dictionary with various overlap metrics
         """
-        resume_set = set(resume_keywords)
-        job_set = set(job_keywords)
+        resume_set = resume_keywords if isinstance(resume_keywords, (set, frozenset)) else set(resume_keywords)
+        job_set = job_keywords if isinstance(job_keywords, (set, frozenset)) else set(job_keywords)
         
         matched_keywords = resume_set.intersection(job_set)
         
@@ -67,29 +68,107 @@ class SimilarityCalculator:
             'coverage_percentage': round(match_rate * 100, 2)
         }
     
-    def cosine_similarity_score(self, resume_text: str, job_text: str) -> float:
+    def skills_mask_overlap_score(self, resume_mask: np.ndarray, job_mask: np.ndarray,
+                                  skill_table: np.ndarray) -> Dict[str, any]:
+        """
+        keyword_overlap_score for skill sets given as boolean masks over a skill table
+        
+        Args:
+            resume_mask: Resume skills, True where skill_table[i] was detected
+            job_mask: Job description skills, same layout as resume_mask
+            skill_table: Sorted array of skill names the masks index into
+            
+        Returns:
+            keyword_overlap_score metrics, with 'matched_keywords' and
+            'missing_keywords' sorted (the table order)
+        """
+        matched_mask = resume_mask & job_mask
+        matched_count = int(np.count_nonzero(matched_mask))
+        job_count = int(np.count_nonzero(job_mask))
+        union_count = int(np.count_nonzero(resume_mask | job_mask))
+        
+        # Same empty-set convention as jaccard_similarity
+        jaccard = matched_count / union_count if job_count and resume_mask.any() else 0.0
+        match_rate = matched_count / job_count if job_count else 0.0
+        
+        return {
+            'jaccard_similarity': round(jaccard, 4),
+            'match_rate': round(match_rate, 4),
+            'matched_keywords': skill_table[matched_mask].tolist(),
+            'missing_keywords': skill_table[job_mask & ~resume_mask].tolist(),
+            'matched_count': matched_count,
+            'total_job_keywords': job_count,
+            'coverage_percentage': round(match_rate * 100, 2)
+        }
+    
+    def term_counts(self, text: str) -> Counter:
+        """
+        Count the terms (1-2 grams) of a text as the TF-IDF text similarity tokenizes it
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Counter of term -> occurrences
+        """
+        return Counter(self._tfidf_analyzer(text))
+    
+    def cosine_similarity_score(self, resume_text: str, job_text: str,
+                                job_terms: Optional[Counter] = None,
+                                resume_terms: Optional[Counter] = None) -> float:
         """
         Calculate cosine similarity between resume and job description texts
         
+        Same result as fitting a TfidfVectorizer on the two texts, computed
+        from term counts so the job description can be tokenized once and
+        reused across resumes.
+        
         Args:
             resume_text: Resume text
             job_text: Job description text
+            job_terms: term_counts(job_text), if already computed
+            resume_terms: term_counts(resume_text), if already computed
             
         Returns:
             Cosine similarity score (0 to 1)
         """
-        try:
-            vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_text])
-            
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return round(float(similarity), 4)
-        except:
+        if resume_terms is None:
+            resume_terms = self.term_counts(resume_text)
+        if job_terms is None:
+            job_terms = self.term_counts(job_text)
+        
+        if not resume_terms or not job_terms:
             return 0.0
+        
+        # Smoothed IDF over the two documents: 1 for shared terms, 1 + ln(3/2) otherwise.
+        # Only shared terms contribute to the dot product; each norm is the
+        # squared counts weighted by idf^2, computed as a total and a correction
+        # for the shared terms so the per-term work stays in C.
+        unique_idf_sq = (1.0 + math.log(1.5)) ** 2
+        shared = resume_terms.keys() & job_terms.keys()
+        resume_shared = np.fromiter((resume_terms[t] for t in shared), dtype=np.float64, count=len(shared))
+        job_shared = np.fromiter((job_terms[t] for t in shared), dtype=np.float64, count=len(shared))
+        
+        dot = resume_shared @ job_shared
+        resume_norm = self._idf_weighted_norm_sq(resume_terms, resume_shared, unique_idf_sq)
+        job_norm = self._idf_weighted_norm_sq(job_terms, job_shared, unique_idf_sq)
+        
+        similarity = dot / math.sqrt(resume_norm * job_norm)
+        return round(float(similarity), 4)
+    
+    @staticmethod
+    def _idf_weighted_norm_sq(terms: Counter, shared_counts: np.ndarray, unique_idf_sq: float) -> float:
+        """Squared L2 norm of a TF-IDF vector: shared terms weigh 1, the others unique_idf_sq"""
+        counts = np.fromiter(terms.values(), dtype=np.float64, count=len(terms))
+        shared_sq = shared_counts @ shared_counts
+        return unique_idf_sq * (counts @ counts - shared_sq) + shared_sq
     
     def calculate_weighted_score(self, resume_text: str, job_text: str,
                                 resume_keywords: Dict[str, List[str]],
-                                job_keywords: Dict[str, List[str]]) -> Dict[str, any]:
+                                job_keywords: Dict[str, List[str]],
+                                job_terms: Optional[Counter] = None,
+                                resume_terms: Optional[Counter] = None,
+                                skill_masks: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> Dict[str, any]:
         """
         Calculate comprehensive weighted similarity score
         
@@ -98,12 +177,16 @@ class SimilarityCalculator:
             job_text: Full job description text
             resume_keywords: Extracted resume keywords
             job_keywords: Extracted job description keywords
+            job_terms: term_counts(job_text), if already computed
+            resume_terms: term_counts(resume_text), if already computed
+            skill_masks: (resume_mask, job_mask, skill_table) for the technical
+                skills; when given, the skill sets are compared as boolean masks
             
         Returns:
             Dictionary with detailed scoring information
         """
         # Calculate cosine similarity on full text
-        text_similarity = self.cosine_similarity_score(resume_text, job_text)
+        text_similarity = self.cosine_similarity_score(resume_text, job_text, job_terms, resume_terms)
         
         # Calculate keyword overlap for all keywords
         all_kw_overlap = self.keyword_overlap_score(
@@ -112,37 +195,25 @@ class SimilarityCalculator:
         )
         
         # Calculate technical skills match (heavily weighted)
-        skills_overlap = self.keyword_overlap_score(
-            resume_keywords.get('technical_skills', []),
-            job_keywords.get('technical_skills', [])
-        )
+        if skill_masks is not None:
+            skills_overlap = self.skills_mask_overlap_score(*skill_masks)
+            matched_skills = skills_overlap['matched_keywords']
+            missing_skills = skills_overlap['missing_keywords']
+        else:
+            resume_skills = frozenset(resume_keywords.get('technical_skills', []))
+            job_skills = frozenset(job_keywords.get('technical_skills', []))
+            skills_overlap = self.keyword_overlap_score(resume_skills, job_skills)
+            matched_skills = sorted(skills_overlap['matched_keywords'])
+            missing_skills = sorted(job_skills - resume_skills)
         
-        # Calculate TF-IDF keywords overlap
-        tfidf_overlap = self.keyword_overlap_score(
-            resume_keywords.get('tfidf_keywords', []),
-            job_keywords.get('tfidf_keywords', [])
+        # Weighted scoring (optimized for skills-based matching):
+        # Skills 60%, All keywords 30%, Text 10%
+        weighted_score = (
+            skills_overlap['match_rate'] * 0.60 +
+            all_kw_overlap['match_rate'] * 0.30 +
+            text_similarity * 0.10
         )
         
-        # Weighted scoring (optimized for skills-based matching)
-        # If TF-IDF matching fails (returns 0 keywords), redistribute its weight to skills
-        has_tfidf = len(resume_keywords.get('tfidf_keywords', [])) > 0 and len(job_keywords.get('tfidf_keywords', [])) > 0
-        
-        if has_tfidf:
-            # Normal weights: Skills 50%, TF-IDF 25%, All keywords 15%, Text 10%
-            weighted_score = (
-                skills_overlap['match_rate'] * 0.50 +
-                tfidf_overlap['match_rate'] * 0.25 +
-                all_kw_overlap['match_rate'] * 0.15 +
-                text_similarity * 0.10
-            )
-        else:
-            # TF-IDF failed, redistribute: Skills 60%, All keywords 30%, Text 10%
-            weighted_score = (
-                skills_overlap['match_rate'] * 0.60 +
-                all_kw_overlap['match_rate'] * 0.30 +
-                text_similarity * 0.10
-            )
-        
         # Calculate overall percentage
         overall_percentage = round(weighted_score * 100, 2)
         
@@ -165,16 +236,11 @@ class SimilarityCalculator:
             'detailed_scores': {
                 'text_similarity': text_similarity,
                 'skills_match_rate': skills_overlap['match_rate'],
-                'tfidf_match_rate': tfidf_overlap['match_rate'],
                 'all_keywords_match_rate': all_kw_overlap['match_rate']
             },
-            'matched_skills': skills_overlap['matched_keywords'],
-            'matched_tfidf_keywords': tfidf_overlap['matched_keywords'],
+            'matched_skills': matched_skills,
             'skills_coverage': skills_overlap['coverage_percentage'],
-            'missing_skills': list(
-                set(job_keywords.get('technical_skills', [])) - 
-                set(resume_keywords.get('technical_skills', []))
-            )
+            'missing_skills': missing_skills
         }
     
     def generate_recommendations(self, score_results: Dict) -> List[str]: